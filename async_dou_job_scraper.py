@@ -0,0 +1,172 @@
+import asyncio, time
+from urllib.parse import urlsplit
+
+import httpx
+
+from base_job_scraper import AsyncBaseJobScraper, MATCHED, PAGE_END
+from dou_job_scraper import DouCardChecks, DouJobScraper
+from dou_parser import DouBatch, get_extractor
+from utils.fetcher import AsyncHostRateLimiter
+from utils.link_set import CompactLinkSet
+from utils.pipeline import Pipeline, Stage
+from utils.delays import PacingScheduler
+from utils.http_cache import HttpCache
+
+class AsyncDouJobScraper(DouCardChecks, AsyncBaseJobScraper):
+    """
+    DOU scraper on one pooled keep-alive httpx.AsyncClient.
+
+    Same pages, filters and output as DouJobScraper; the next AJAX batch
+    downloads while the current one is filtered, detail pages are fetched
+    concurrently (MAX_WORKERS, REQUESTS_PER_SECOND per host).
+    """
+    SEARCH_URL = DouJobScraper.SEARCH_URL
+    AJAX_URL = DouJobScraper.AJAX_URL
+    MAX_WORKERS = DouJobScraper.MAX_WORKERS
+    REQUESTS_PER_SECOND = DouJobScraper.REQUESTS_PER_SECOND
+    PACING = DouJobScraper.PACING
+    INCREMENTAL = DouJobScraper.INCREMENTAL
+    HTTP_CACHE = DouJobScraper.HTTP_CACHE
+    HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+    def __init__(self, filters, logger, max_workers=None, requests_per_second=None, extractor=None, pacing=None,
+                 http_cache=True):
+        self.filters = filters
+        self.logger = logger
+        self.extractor = get_extractor(extractor)
+        # one listing budget per host for all DOU searches of the run
+        self.pacer = PacingScheduler.shared(urlsplit(self.SEARCH_URL).netloc,
+                                            {**self.PACING, **(pacing or {})}, logger)
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.limiter = AsyncHostRateLimiter(requests_per_second or self.REQUESTS_PER_SECOND)
+        self.client = httpx.AsyncClient(
+            headers=self.HEADERS,
+            limits=httpx.Limits(max_connections=self.max_workers + 1, max_keepalive_connections=self.max_workers + 1),
+            timeout=30,
+            follow_redirects=True,
+        )
+        self.http_cache = HttpCache(**self.HTTP_CACHE) if http_cache else None
+        self.csrf_token = None
+        self.seen_links = CompactLinkSet()
+        self.existing_links = set()
+        self.cheap_stages = Pipeline([
+            Stage("dedupe", keep=self.is_new_card),
+            Stage("title", keep=self.card_matches_title),
+            Stage("location", keep=self.card_matches_location),
+            Stage("verdict", keep=self.card_not_rejected),
+            Stage("repost", keep=self.flag_repost),
+        ], logger)
+        # fetch is async, its counters are updated in process_batch
+        self.fetch_stage = Stage("fetch")
+        self.near_dup_stage = Stage("near-dup", keep=self.flag_near_duplicate)
+        self.text_stage = Stage("text", keep=self.job_matches_text)
+
+    def get_logger(self):
+        return self.logger
+
+    def init_url(self, search_url, ajax_url):
+        self.SEARCH_URL = search_url
+        self.AJAX_URL = ajax_url
+
+    async def fetch_batch(self, page):
+        """Initial page (also sets the CSRF token) or AJAX batch, parsed once."""
+        self.metrics.observe("sleep_seconds", await asyncio.to_thread(self.pacer.spend, "page"), action="page")
+        started = time.monotonic()
+        if page == 1:
+            with self.metrics.timer("page_fetch_seconds"):
+                resp = await self.client.get(self.SEARCH_URL)
+                resp.raise_for_status()
+            with self.metrics.timer("card_extract_seconds"):
+                cards, token = self.extractor.parse_listing(resp.text)
+            if token:
+                self.csrf_token = token
+            self.metrics.inc("cards_total", len(cards))
+            return DouBatch(page, cards)
+
+        if not self.csrf_token:
+            raise RuntimeError("CSRF token missing. Fetch page 1 first.")
+        self.logger.info(f"🔎 Fetching next {20} jobs from AJAX")
+        with self.metrics.timer("page_fetch_seconds"):
+            resp = await self.client.post(
+                self.AJAX_URL,
+                headers={"Referer": self.SEARCH_URL, "X-Requested-With": "XMLHttpRequest"},
+                data={"csrfmiddlewaretoken": self.csrf_token, "count": 20*page},
+            )
+            resp.raise_for_status()
+        self.pacer.observe(time.monotonic() - started)
+        with self.metrics.timer("card_extract_seconds"):
+            cards, _ = self.extractor.parse_listing(resp.json().get("html", ""))
+        self.metrics.inc("cards_total", len(cards))
+        return DouBatch(page, cards)
+
+    async def fetch_detail(self, url):
+        """Fetch the full vacancy description from its page."""
+        cache = self.http_cache
+        entry = cache.get(url) if cache is not None else None
+        if entry is not None and cache.is_fresh(entry):
+            cache.hits += 1
+            return self.extractor.parse_description(entry.body.decode("utf-8", "replace"))
+        await self.limiter.wait(url)
+        try:
+            with self.metrics.timer("detail_fetch_seconds"):
+                resp = await self.client.get(url, headers=cache.validators(entry) if entry is not None else None)
+            if resp.status_code == 304 and entry is not None:
+                cache.refresh(url)
+                return self.extractor.parse_description(entry.body.decode("utf-8", "replace"))
+            resp.raise_for_status()
+            if cache is not None:
+                cache.put(url, resp.status_code, dict(resp.headers), resp.content)
+            return self.extractor.parse_description(resp.text)
+        except Exception as e:
+            self.metrics.inc("detail_fetch_errors_total")
+            self.logger.warning(f"⚠️ Failed to fetch full description for {url}: {e}")
+            return ""
+
+    async def process_batch(self, batch, existing_links):
+        self.logger.info(f"🌍 Parsing page {batch.page}: {len(batch.cards)} vacancies")
+        self.existing_links = existing_links
+        cards = self.cheap_stages.run(batch.cards, self.metrics)
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(card):
+            description = self.stored_description(card)
+            if description is not None:
+                return self.card_to_job(card, description)
+            async with semaphore:
+                return self.card_to_job(card, await self.fetch_detail(card["link"]))
+
+        started = time.perf_counter()
+        jobs = await asyncio.gather(*(fetch(card) for card in cards))
+        self.fetch_stage.seen += len(cards)
+        self.fetch_stage.seconds += time.perf_counter() - started
+        self.metrics.observe("stage_seconds", time.perf_counter() - started, stage=self.fetch_stage.name)
+        self.metrics.inc("stage_items_total", len(cards), stage=self.fetch_stage.name)
+        jobs = self.text_stage.run(self.near_dup_stage.run(jobs, self.metrics), self.metrics)
+        for job in jobs:
+            self.logger.info(f"✅ Match found: {job.title} @ {job.company} (score {job.score})")
+        return jobs
+
+    async def iter_events(self, existing_links):
+        batch = await self.fetch_batch(1)
+        next_batch = None
+        try:
+            while batch.cards:
+                # next batch downloads while this one is filtered and stored
+                next_batch = asyncio.create_task(self.fetch_batch(batch.page + 1))
+                for job in await self.process_batch(batch, existing_links):
+                    yield MATCHED, job
+                yield PAGE_END, None
+                batch = await next_batch
+                next_batch = None
+            self.logger.info("No more vacancies returned from DOU.")
+        finally:
+            if next_batch is not None:
+                next_batch.cancel()
+
+    async def aclose(self):
+        Pipeline(self.cheap_stages.stages + [self.fetch_stage, self.near_dup_stage, self.text_stage], self.logger).report()
+        self.pacer.report()
+        if self.http_cache is not None:
+            self.http_cache.report(self.logger)
+        await self.client.aclose()
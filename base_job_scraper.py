@@ -1,6 +1,35 @@
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.metrics import NO_METRICS
+
+# Tags of the (tag, job) events scrapers stream to storage
+MATCHED = "matched"              # passed all filters -> main output file
+MATCHED_TITLE = "matched_title"  # title matched, rejected later -> *_matched_title file
+PAGE_END = "page_end"            # async streams only: a listing page is done (job is None)
 
 class BaseJobScraper(ABC):
+    # True when the user may need to log in in the browser before scraping
+    NEEDS_LOGIN = False
+    # Early-stop rules for incremental runs (see utils.watermark.IncrementalCrawl)
+    INCREMENTAL = {"watermark": False, "known_streak": 0, "known_page": False}
+    # IncrementalCrawl of the current run, set by run_scraper; scrapers report cards to it
+    crawl = None
+    # DescriptionStore for re-post detection, set by run_scraper when enabled
+    descriptions = None
+    # RejectedJobs under the current filters, set by run_scraper
+    verdicts = None
+    # utils.metrics.Metrics of the current run, set by run_scraper
+    metrics = NO_METRICS
+    # long-lived browser shared by several searches (see open_session), None = own browser
+    browser_session = None
+
+    @classmethod
+    def open_session(cls, headless=False):
+        """Browser session to share between searches of this site; None for HTTP scrapers."""
+        return None
+
     @abstractmethod
     def get_logger(self):
         """Return logger"""
@@ -20,11 +49,119 @@ class BaseJobScraper(ABC):
         pass
 
     @abstractmethod
-    def scrape_jobs(self):
-        """Scrape jobs and return as list of dicts"""
+    def scrape_jobs(self, existing_links):
+        """Yield (MATCHED or MATCHED_TITLE, utils.job.Job) events for the current page"""
         pass
 
     @abstractmethod
     def go_to_next_page(self):
         """Click next page if available, return True/False"""
-        pass
\ No newline at end of file
+        pass
+
+
+class AsyncBaseJobScraper(ABC):
+    """
+    Async counterpart of BaseJobScraper.
+
+    iter_events() is an async generator yielding the same (tag, job) events
+    as scrape_jobs(), plus (PAGE_END, None) after each page.
+    """
+    NEEDS_LOGIN = False
+    INCREMENTAL = BaseJobScraper.INCREMENTAL
+    crawl = None
+    descriptions = None
+    verdicts = None
+    metrics = NO_METRICS
+
+    @abstractmethod
+    def get_logger(self):
+        """Return logger"""
+        pass
+
+    @abstractmethod
+    def init_url(self, search_url, ajax_url):
+        """Init search url"""
+        pass
+
+    @abstractmethod
+    def iter_events(self, existing_links):
+        """Async iterator over (tag, job) events of all pages"""
+        pass
+
+    @abstractmethod
+    async def aclose(self):
+        """Release connections / browser"""
+        pass
+
+
+class SyncScraperAdapter(AsyncBaseJobScraper):
+    """
+    Runs a blocking BaseJobScraper on its own thread so it can share an event
+    loop with async scrapers. One thread per scraper: Selenium drivers must not
+    be used from several threads.
+    """
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+        self.NEEDS_LOGIN = scraper.NEEDS_LOGIN
+        self.INCREMENTAL = scraper.INCREMENTAL
+        self.SEARCH_URL = getattr(scraper, "SEARCH_URL", "")
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    @property
+    def crawl(self):
+        return self.scraper.crawl
+
+    @crawl.setter
+    def crawl(self, value):
+        self.scraper.crawl = value
+
+    @property
+    def descriptions(self):
+        return self.scraper.descriptions
+
+    @descriptions.setter
+    def descriptions(self, value):
+        self.scraper.descriptions = value
+
+    @property
+    def verdicts(self):
+        return self.scraper.verdicts
+
+    @verdicts.setter
+    def verdicts(self, value):
+        self.scraper.verdicts = value
+
+    @property
+    def metrics(self):
+        return self.scraper.metrics
+
+    @metrics.setter
+    def metrics(self, value):
+        self.scraper.metrics = value
+
+    async def _call(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def get_logger(self):
+        return self.scraper.get_logger()
+
+    def init_url(self, search_url, ajax_url):
+        self.scraper.init_url(search_url, ajax_url)
+        self.SEARCH_URL = search_url
+
+    async def iter_events(self, existing_links):
+        await self._call(self.scraper.setup_driver)
+        while True:
+            # the generator runs on the scraper thread, one event per hop
+            events = await self._call(self.scraper.scrape_jobs, existing_links)
+            while (event := await self._call(next, events, None)) is not None:
+                yield event
+            yield PAGE_END, None
+            if not await self._call(self.scraper.go_to_next_page):
+                break
+
+    async def aclose(self):
+        await self._call(self.scraper.driver_quit)
+        self._executor.shutdown(wait=True)
+
@@ -0,0 +1,99 @@
+"""
+Compare DOU extractors on saved HTML fixtures.
+
+    python -m benchmarks.bench_dou_parser [-n 200] [-fixtures DIR]
+
+Reports pages/sec per extractor for the listing page (cards + CSRF token)
+and the vacancy page (full description), and the memory one parse needs:
+"py heap" is the tracemalloc peak, which only sees Python objects (not
+libxml2's C allocations), "RSS" is the resident size growth of a fresh
+subprocess parsing the page once (after a tiny warm-up page, so one-time
+parser setup is not counted; freed memory stays resident in the child).
+"""
+import argparse, os, subprocess, sys, time, tracemalloc
+
+from benchmarks.bench_scale import rss_bytes
+from dou_parser import EXTRACTORS, get_extractor
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def bench(func, html, n):
+    func(html)  # warm up
+    start = time.perf_counter()
+    for _ in range(n):
+        func(html)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return n / seconds, peak
+
+
+PAGES = {"listing": "dou_listing.html", "vacancy": "dou_vacancy.html"}
+# smallest page with a card and a description section
+WARM_UP_HTML = (
+    '<html><body><li class="l-vacancy"><div class="title"><a class="vt" href="/v/1/">QA</a></div></li>'
+    '<div class="b-typo vacancy-section"><p>QA</p></div></body></html>'
+)
+
+
+def read_page(fixtures, page):
+    with open(os.path.join(fixtures, PAGES[page]), encoding="utf-8") as f:
+        return f.read()
+
+
+def parse_once(name, page, fixtures):
+    """Child process: print the RSS growth (bytes) of one parse."""
+    extractor = get_extractor(name)
+    html = read_page(fixtures, page)
+    func = extractor.parse_listing if page == "listing" else extractor.parse_description
+    func(WARM_UP_HTML)
+    before = rss_bytes()
+    func(html)
+    print(rss_bytes() - before)
+
+
+def rss_growth(name, page, fixtures):
+    """RSS growth of one parse, measured in a fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_dou_parser", "-rss", name, page, "-fixtures", fixtures],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    return int(out.stdout.split()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DOU extractor benchmark")
+    parser.add_argument("-n", type=int, default=200, help="Pages parsed per measurement")
+    parser.add_argument("-fixtures", default=FIXTURES_DIR, help="Directory with dou_listing.html / dou_vacancy.html")
+    parser.add_argument("-rss", nargs=2, metavar=("EXTRACTOR", "PAGE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.rss:
+        parse_once(*args.rss, args.fixtures)
+        return
+
+    listing = read_page(args.fixtures, "listing")
+    vacancy = read_page(args.fixtures, "vacancy")
+
+    print(f"{'extractor':<10} {'page':<8} {'pages/sec':>10} {'py heap KiB':>12} {'RSS KiB':>8}")
+    for name in EXTRACTORS:
+        try:
+            extractor = get_extractor(name)
+        except RuntimeError as e:
+            print(f"{name:<10} skipped: {e}")
+            continue
+        for page, func, html in (
+            ("listing", extractor.parse_listing, listing),
+            ("vacancy", extractor.parse_description, vacancy),
+        ):
+            rate, peak = bench(func, html, args.n)
+            rss = rss_growth(name, page, args.fixtures)
+            print(f"{name:<10} {page:<8} {rate:>10.1f} {peak / 1024:>12.1f} {rss / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Filters and Storage at scale, on synthetic corpora (offline).
+
+    python -m benchmarks.bench_scale [-sizes 10000,100000,1000000] [-out bench_scale.json]
+    python -m benchmarks.bench_scale -compare bench_scale.json -out new.json
+
+Filters: titles/sec and descriptions/sec (MB/s) per rule set, and the
+time to compile the rules. Storage, per history size: first startup
+(scan of the text file + index build), indexed startup, compact link set
+build/load, append throughput through JobWriter, the memory each loaded
+link set holds (tracemalloc) and the process RSS. Results are written as JSON together with the
+git commit; -compare prints the change against an earlier results file.
+"""
+import argparse, gc, json, logging, os, platform, shutil, subprocess, sys, tempfile, time, tracemalloc
+
+from benchmarks.corpus import Corpus
+from utils.filters import Filters
+from utils.storage import JobWriter, Storage
+
+logger = logging.getLogger("benchmarks.bench_scale")
+
+# rule sets: Filters attribute -> value (missing ones keep the Filters defaults)
+RULE_SETS = {
+    "default": {},
+    "location": {"MUST_HAVE_LOCATION": ["Київ", "Kyiv", "віддалено", "Remote"]},
+    "wide": {
+        "MUST_HAVE_TITLE": Filters.MUST_HAVE_TITLE + ["SDET", "Tester", r"\bQC\b", "Test Engineer", "Test Lead",
+                                                      "Quality Engineer", "Automation Engineer", "Performance"],
+        "EXCLUDE_TITLE": Filters.EXCLUDE_TITLE + ["Manual", "Intern", "Trainee", "Mobile", "Android", "Go", "PHP"],
+        "MUST_HAVE_TEXT": [r"\bJava\b", "Kotlin", "Playwright"],
+        "OPTIONAL_TEXT": Filters.OPTIONAL_TEXT + ["REST", "Docker", "Kubernetes", "Jenkins", "AWS", "Postman",
+                                                  "JMeter", "Jira", r"\bGit\b", "Allure", "Gradle", "Maven"],
+        "EXCLUDE_TEXT": ["gambling", "casino", r"\bC\+\+\b", "relocation only"],
+    },
+}
+
+
+# -----------------------------------
+# MEASUREMENT HELPERS
+# -----------------------------------
+def peak_rss_bytes():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def rss_bytes():
+    """Current resident set size (Linux /proc), else the peak so far."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return peak_rss_bytes()
+
+
+def held_bytes(func, *args):
+    """Run func once more under tracemalloc: bytes its result keeps allocated."""
+    gc.collect()
+    tracemalloc.start()
+    result = func(*args)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return held
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+# -----------------------------------
+# FILTERS
+# -----------------------------------
+def make_filters(rules):
+    filters = Filters(logger)
+    for name, value in rules.items():
+        setattr(filters, name, value)
+    filters.invalidate()
+    return filters
+
+
+def bench_filters(rules, titles, descriptions):
+    filters = make_filters(rules)
+    _, compile_seconds = timed(lambda: [filters.engine(field) for field in Filters.FIELD_GROUPS])
+
+    def run_titles():
+        return sum(filters.job_matches_title(t) for t in titles)
+
+    def run_text():
+        return sum(filters.match_text(d)[0] for d in descriptions)
+
+    title_hits, title_seconds = timed(run_titles)
+    text_hits, text_seconds = timed(run_text)
+    megabytes = sum(len(d.encode("utf-8")) for d in descriptions) / 1e6
+    result = {
+        "compile_seconds": round(compile_seconds, 6),
+        "titles_per_sec": round(len(titles) / title_seconds, 1),
+        "title_match_rate": round(title_hits / len(titles), 4),
+        "descriptions_per_sec": round(len(descriptions) / text_seconds, 1),
+        "text_mb_per_sec": round(megabytes / text_seconds, 2),
+        "text_match_rate": round(text_hits / len(descriptions), 4),
+    }
+    if rules.get("MUST_HAVE_LOCATION"):
+        locations = [job.location for job in Corpus().iter_jobs(len(titles), descriptions=False)]
+        _, location_seconds = timed(lambda: [filters.job_matches_location(l) for l in locations])
+        result["locations_per_sec"] = round(len(locations) / location_seconds, 1)
+    return result
+
+
+# -----------------------------------
+# STORAGE
+# -----------------------------------
+def bench_storage(corpus, workdir, size, description_chars, append):
+    path = os.path.join(workdir, f"jobs_{size}.txt")
+    _, generate_seconds = timed(corpus.write_storage_file, path, size, description_chars)
+    result = {
+        "jobs": size,
+        "text_file_mb": round(os.path.getsize(path) / 1e6, 2),
+        "generate_seconds": round(generate_seconds, 3),
+    }
+
+    # first start without an index: streaming scan of the text file + index build
+    os.remove(path + Storage.INDEX_SUFFIX)
+    storage = Storage(logger, path)
+    _, result["startup_scan_seconds"] = timed(storage.load_existing_jobs)
+    storage.index.conn.close()
+
+    # regular start: keys from the index, plus the memory the set holds
+    storage = Storage(logger, path)
+    _, result["startup_index_seconds"] = timed(storage.load_existing_jobs)
+    result["link_set_mb"] = round(held_bytes(storage.load_existing_jobs) / 1e6, 2)
+
+    # compact link set: built once (and saved), then loaded from <file>.links.bin
+    _, result["compact_build_seconds"] = timed(storage.load_existing_jobs, True)
+    known, result["compact_load_seconds"] = timed(storage.load_existing_jobs, True)
+    result["compact_set_mb"] = round(held_bytes(storage.load_existing_jobs, True) / 1e6, 2)
+    result["rss_mb"] = round(rss_bytes() / 1e6, 2)
+
+    # appends as a run streams them: JobWriter flushing every FLUSH_EVERY jobs
+    new_jobs = Corpus(corpus.seed, description_chars).jobs(append, start=size)
+    writer = JobWriter(storage, known)
+
+    def write_all():
+        for job in new_jobs:
+            writer.add(job)
+        writer.flush()
+
+    _, append_seconds = timed(write_all)
+    result["append_jobs_per_sec"] = round(writer.written / append_seconds, 1)
+    storage.index.conn.close()
+    for round_seconds in ("startup_scan_seconds", "startup_index_seconds", "compact_build_seconds",
+                          "compact_load_seconds"):
+        result[round_seconds] = round(result[round_seconds], 4)
+    return result
+
+
+# -----------------------------------
+# REPORT / COMPARE
+# -----------------------------------
+def flatten(results, prefix=""):
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)):
+            flat[prefix + key] = value
+    return flat
+
+
+def compare(base, current):
+    """Print metrics present in both runs with their relative change."""
+    old, new = flatten(base["results"]), flatten(current["results"])
+    print(f"\nvs {base.get('commit') or '?'} ({base.get('created', '?')})")
+    print(f"{'metric':<52} {'before':>12} {'after':>12} {'change':>8}")
+    for key in sorted(old.keys() & new.keys()):
+        a, b = old[key], new[key]
+        change = f"{(b - a) / a * 100:+.1f}%" if a else ""
+        print(f"{key:<52} {a:>12} {b:>12} {change:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Filters / Storage scale benchmark (synthetic corpora)")
+    parser.add_argument("-sizes", default="10000,100000", help="Comma-separated saved-history sizes (jobs)")
+    parser.add_argument("-rules", default=",".join(RULE_SETS), help="Comma-separated rule sets to run")
+    parser.add_argument("-titles", type=int, default=20000, help="Titles matched per rule set")
+    parser.add_argument("-descriptions", type=int, default=2000, help="Descriptions matched per rule set")
+    parser.add_argument("-description-chars", type=int, default=3000, help="Size of a filtered description")
+    parser.add_argument("-storage-description-chars", type=int, default=500,
+                        help="Size of a saved description (keeps 1M-job files manageable)")
+    parser.add_argument("-append", type=int, default=2000, help="Jobs appended per history size")
+    parser.add_argument("-seed", type=int, default=1)
+    parser.add_argument("-dir", help="Work directory for the generated files (default: a temp dir, removed)")
+    parser.add_argument("-out", default="bench_scale.json", help="Results file (JSON)")
+    parser.add_argument("-compare", metavar="FILE", help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    corpus = Corpus(args.seed, args.description_chars)
+    results = {"filters": {}, "storage": {}}
+
+    titles = corpus.titles(args.titles)
+    descriptions = corpus.descriptions(args.descriptions)
+    print(f"{'rules':<10} {'titles/sec':>12} {'descr/sec':>10} {'MB/s':>8} {'compile ms':>11}")
+    for name in args.rules.split(","):
+        r = results["filters"][name] = bench_filters(RULE_SETS[name], titles, descriptions)
+        print(f"{name:<10} {r['titles_per_sec']:>12} {r['descriptions_per_sec']:>10} {r['text_mb_per_sec']:>8} "
+              f"{r['compile_seconds'] * 1000:>11.2f}")
+
+    workdir = args.dir or tempfile.mkdtemp(prefix="bench_scale_")
+    os.makedirs(workdir, exist_ok=True)
+    try:
+        print(f"\n{'jobs':>9} {'txt MB':>8} {'scan s':>8} {'index s':>8} {'set MB':>7} "
+              f"{'compact s':>10} {'cset MB':>8} {'append/s':>9} {'RSS MB':>8}")
+        for size in (int(s) for s in args.sizes.split(",")):
+            r = results["storage"][str(size)] = bench_storage(
+                corpus, workdir, size, args.storage_description_chars, args.append
+            )
+            print(f"{size:>9} {r['text_file_mb']:>8} {r['startup_scan_seconds']:>8} {r['startup_index_seconds']:>8} "
+                  f"{r['link_set_mb']:>7} {r['compact_load_seconds']:>10} {r['compact_set_mb']:>8} "
+                  f"{r['append_jobs_per_sec']:>9} {r['rss_mb']:>8}")
+    finally:
+        if not args.dir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "commit": git_commit(),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": vars(args),
+        "peak_rss_mb": round(peak_rss_bytes() / 1e6, 2),
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print(f"\n📊 Results saved to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Synthetic job corpora for the scale benchmarks (deterministic, offline).
+
+    from benchmarks.corpus import Corpus
+    corpus = Corpus(seed=1, description_chars=3000)
+    jobs = corpus.jobs(10_000)          # list of utils.job.Job
+    corpus.write_storage_file(path, 100_000)
+
+Titles mix QA/automation roles (matching the default Filters) with other
+engineering roles; descriptions are multi-kilobyte word salad seeded with
+the technology keywords the filters look for. Links are DOU-style, so
+CompactLinkSet keeps them as numeric ids.
+"""
+import logging, random
+
+from utils.job import Job
+from utils.storage import Storage
+
+ROLES = [
+    "QA Automation Engineer", "Senior QA Engineer", "AQA Engineer (Java)", "Test Automation Engineer",
+    "Quality Assurance Lead", "Software Engineer in Test", "Manual QA", "Python Developer",
+    "Java Developer", "Frontend Engineer (React)", "iOS Developer", "DevOps Engineer", "Data Engineer",
+    "C# .NET Developer", "Product Manager", "Automation Test Engineer (Python)",
+]
+LEVELS = ["", "Junior ", "Middle ", "Senior ", "Lead ", "Strong Middle "]
+COMPANIES = [f"company-{i}" for i in range(400)]
+LOCATIONS = ["Київ", "Львів", "Харків", "Дніпро", "Одеса", "віддалено", "Kyiv, Ukraine", "Remote", "Warsaw, Poland"]
+KEYWORDS = [
+    "Java", "Cucumber", "SQL", "API", "Selenium", "TestNG", "TeamCity", "Python", "Playwright", "Kotlin",
+    "REST", "Docker", "Kubernetes", "Jenkins", "AWS", "Postman", "JMeter", "Git", "Jira", "C#",
+]
+FILLER = (
+    "we are looking for an engineer to join our team and help build reliable products for customers "
+    "across the world you will work closely with developers designers and product owners on new features "
+    "responsibilities include planning test strategy writing automated tests reviewing requirements "
+    "and improving the delivery pipeline we offer flexible hours paid vacation medical insurance "
+    "education budget and a friendly atmosphere experience with modern tools is a plus"
+).split()
+
+
+class Corpus:
+    """Deterministic generator of Jobs: same seed, same corpus."""
+    FIRST_ID = 100000
+
+    def __init__(self, seed=1, description_chars=3000, keyword_rate=0.02):
+        self.seed = seed
+        self.description_chars = description_chars
+        self.keyword_rate = keyword_rate
+
+    def _rng(self, salt):
+        return random.Random(f"{self.seed}:{salt}")
+
+    def title(self, rnd):
+        return rnd.choice(LEVELS) + rnd.choice(ROLES)
+
+    def description(self, rnd):
+        words, size = [], 0
+        while size < self.description_chars:
+            word = rnd.choice(KEYWORDS) if rnd.random() < self.keyword_rate else rnd.choice(FILLER)
+            words.append(word)
+            size += len(word) + 1
+        return " ".join(words)
+
+    @staticmethod
+    def link(company, job_id):
+        return f"https://jobs.dou.ua/companies/{company}/vacancies/{job_id}/"
+
+    def iter_jobs(self, n, start=0, descriptions=True):
+        """Yield n Jobs; `start` offsets the ids, so later batches are new links."""
+        rnd = self._rng(start)
+        for i in range(start, start + n):
+            company = rnd.choice(COMPANIES)
+            yield Job(
+                title=self.title(rnd),
+                company=company,
+                location=rnd.choice(LOCATIONS),
+                link=self.link(company, self.FIRST_ID + i),
+                description=self.description(rnd) if descriptions else "",
+                date=f"{rnd.randint(1, 28)} жовтня",
+            )
+
+    def jobs(self, n, start=0, descriptions=True):
+        return list(self.iter_jobs(n, start, descriptions))
+
+    def titles(self, n):
+        rnd = self._rng("titles")
+        return [self.title(rnd) for _ in range(n)]
+
+    def descriptions(self, n):
+        rnd = self._rng("descriptions")
+        return [self.description(rnd) for _ in range(n)]
+
+    def write_storage_file(self, path, n, description_chars=None, batch=10000):
+        """
+        Write a Storage text file (and its link index) holding n jobs, batch
+        by batch like a long history of runs. description_chars overrides
+        the description size, short ones keep 1M-job files manageable.
+        """
+        logger = logging.getLogger("benchmarks.corpus")
+        corpus = Corpus(self.seed, description_chars or self.description_chars, self.keyword_rate)
+        storage = Storage(logger, path)
+        written = set()
+        for start in range(0, n, batch):
+            jobs = corpus.jobs(min(batch, n - start), start)
+            storage.save_jobs_to_file(jobs, written)
+            written.update(job.link for job in jobs)
+        storage.index.conn.close()
+        return written
@@ -1,25 +1,184 @@
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 import time
 import random
 import re
+from urllib.parse import urlsplit
 
-from base_job_scraper import BaseJobScraper
+from base_job_scraper import BaseJobScraper, MATCHED
 from utils.filters import Filters
+from utils.fetcher import ConcurrentFetcher
+from utils.pipeline import Pipeline, Stage
+from utils.link_set import CompactLinkSet
+from utils.job import Job
+from utils.description_store import summary_key
+from dou_parser import DouBatch, get_extractor
+from utils.replay import RecordingAdapter, ReplayAdapter
+from utils.http_cache import HttpCache, CachingAdapter
+from utils.delays import PacingScheduler
 
-class DouJobScraper(BaseJobScraper):
+class DouCardChecks:
+    """
+    Card-level pipeline stages shared by the sync and async DOU scrapers.
+    Expects self.filters, self.logger, self.seen_links, self.existing_links.
+    """
+
+    def is_new_card(self, card):
+        link = card["link"]
+        known = (link in self.seen_links or link in self.existing_links
+                 or (self.verdicts is not None and link in self.verdicts))
+        if self.crawl is not None and not card.get("hot"):
+            self.crawl.observe(link, known, card["date"])
+        if not link or link in self.seen_links:
+            return False
+        self.seen_links.add(link)
+        if link in self.existing_links:
+            self.logger.info(f"⏭ Already processed: {card['title']} @ {card['company']}")
+            return False
+        return True
+
+    def card_matches_title(self, card):
+        if not self.filters.job_matches_title(card["title"]):
+            self.logger.info(f"❌ {card['title']} @ {card['company']} : by title (skipped)")
+            self.remember_rejected(card["link"])
+            return False
+        return True
+
+    def card_matches_location(self, card):
+        if not self.filters.job_matches_location(card["location"]):
+            self.logger.info(f"❌ {card['title']} @ {card['company']} : by location (skipped)")
+            self.remember_rejected(card["link"])
+            return False
+        return True
+
+    def remember_rejected(self, link):
+        """Persist a filter reject: a known card on the next run (see is_new_card)."""
+        if self.verdicts is not None:
+            self.verdicts.add(link)
+
+    def card_not_rejected(self, card):
+        """False when the same filters already rejected this vacancy's text."""
+        if self.verdicts is None or card["link"] not in self.verdicts:
+            return True
+        self.logger.info(f"⏭ Rejected earlier with the same filters: {card['title']} @ {card['company']}")
+        return False
+
+    def flag_repost(self, card):
+        """
+        Look the card up by title, company and summary: a saved description
+        is reused instead of fetching the detail page, and a different saved
+        link with it marks the card as a re-post. Never drops a card.
+        """
+        if self.descriptions is None or not card["description_short"]:
+            return True
+        card["summary_key"] = summary_key(card["title"], card["company"], card["description_short"])
+        card["description_hash"] = self.descriptions.find_alias(card["summary_key"])
+        if card["description_hash"] is not None:
+            card["repost_of"] = self.descriptions.other_link(card["description_hash"], card["link"])
+            if card["repost_of"]:
+                self.logger.info(f"♻️ Re-post of {card['repost_of']}: {card['title']} @ {card['company']} (flagged)")
+        return True
+
+    def stored_description(self, card):
+        """Saved full text for a card flag_repost recognized, or None."""
+        if card.get("description_hash") is None:
+            return None
+        return self.descriptions.get(card["description_hash"]) or None
+
+    def flag_near_duplicate(self, job):
+        """Mark a job whose fetched description (nearly) equals one saved under another link."""
+        if self.descriptions is None or job.repost_of:
+            return True
+        if self.descriptions.mark_repost(job):
+            self.logger.info(f"♻️ Same description as {job.repost_of}: {job.title} @ {job.company} (flagged)")
+        return True
+
+    def job_matches_text(self, job):
+        if self.filters.match_job(job):
+            return True
+        # remember the verdict; an empty text means the fetch failed, retry next run
+        if self.verdicts is not None and job.description:
+            self.remember_rejected(job.link)
+        return False
+
+    @staticmethod
+    def card_to_job(card, description):
+        return Job(
+            title=card["title"],
+            company=card["company"],
+            location=card["location"],
+            link=card["link"],
+            description=description,
+            salary=card["salary"],
+            date=card["date"],
+            summary_key=card.get("summary_key"),
+            repost_of=card.get("repost_of"),
+        )
+
+
+class DouJobScraper(DouCardChecks, BaseJobScraper):
     # Default
     SEARCH_URL = "https://jobs.dou.ua/vacancies/?category=QA"
     AJAX_URL = "https://jobs.dou.ua/vacancies/xhr-load/?category=QA"
-    VACANCY_CART = "li.l-vacancy, div.l-vacancy.__hot"
+    # Detail pages fetch: parallel requests and requests/sec to jobs.dou.ua
+    MAX_WORKERS = 4
+    REQUESTS_PER_SECOND = 2.0
+    # Download the next AJAX batch while the current one is filtered
+    PREFETCH = True
+    # Listing is newest-first (except pinned hot cards)
+    INCREMENTAL = {"watermark": True, "known_streak": 40, "known_page": False}
+    # On-disk cache of vacancy pages (HttpCache arguments); listings are never cached
+    HTTP_CACHE = {"ttl": 24 * 3600, "max_bytes": 200 * 1024 * 1024}
+    VACANCY_URL = r"/vacancies/\d+/?$"
+    # Pacing of listing requests (detail pages use REQUESTS_PER_SECOND)
+    PACING = {
+        "rate": 1.0,
+        "burst": 2,
+        "slow_response": 5.0,
+    }
     
-    def __init__(self, filters, logger):
+    def __init__(self, filters, logger, max_workers=None, requests_per_second=None, extractor=None, pacing=None,
+                 http_cache=True):
         self.filters = filters
         self.logger = logger
+        # one listing budget per host for all DOU searches of the run
+        self.pacer = PacingScheduler.shared(urlsplit(self.SEARCH_URL).netloc,
+                                            {**self.PACING, **(pacing or {})}, logger)
+        # "lxml" / "bs4"; default: lxml when installed
+        self.extractor = get_extractor(extractor)
         self.page = 1
         self.session = requests.Session()
         self.csrf_token = None
-        self.seen_links = set()
+        self.seen_links = CompactLinkSet()
+        self.max_workers = max_workers or self.MAX_WORKERS
+        # keep enough pooled connections for all workers
+        self.http_cache = HttpCache(**self.HTTP_CACHE) if http_cache else None
+        if self.http_cache is not None:
+            self._mount(CachingAdapter(self.http_cache, match=self.VACANCY_URL, pool_maxsize=self.max_workers))
+        else:
+            self._mount(requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers))
+        self.fetcher = ConcurrentFetcher(
+            self.fetch_full_description,
+            max_workers=self.max_workers,
+            rate_per_host=requests_per_second or self.REQUESTS_PER_SECOND,
+            # cache hits are answered by CachingAdapter, no request to pace
+            skip_wait=self.served_locally,
+        )
+        self.existing_links = set()
+        self.batch = None
+        self._next_batch = None
+        self._prefetcher = ThreadPoolExecutor(max_workers=1)
+        # Cheap card-level checks first, the HTTP detail fetch only for survivors
+        self.pipeline = Pipeline([
+            Stage("dedupe", keep=self.is_new_card),
+            Stage("title", keep=self.card_matches_title),
+            Stage("location", keep=self.card_matches_location),
+            Stage("verdict", keep=self.card_not_rejected),
+            Stage("repost", keep=self.flag_repost),
+            Stage("fetch", batch=self.fetch_descriptions),
+            Stage("near-dup", keep=self.flag_near_duplicate),
+            Stage("text", keep=self.job_matches_text),
+        ], logger)
     
     def get_logger(self):
         return self.logger
@@ -27,28 +186,50 @@ class DouJobScraper(BaseJobScraper):
     def setup_driver(self):
         pass
     def driver_quit(self):
-        pass
+        self.pipeline.report()
+        self.pacer.report()
+        if self.http_cache is not None:
+            self.http_cache.report(self.logger)
+        self.fetcher.close()
+        self._prefetcher.shutdown(wait=True)
 
     def init_url(self, search_url, ajax_url):
         self.SEARCH_URL = search_url
         self.AJAX_URL = ajax_url
 
+    def _mount(self, adapter):
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def served_locally(self, url):
+        """True if the adapter mounted for url answers it without a request (fresh cache entry)."""
+        check = getattr(self.session.get_adapter(url), "served_locally", None)
+        return check is not None and check(url)
+
+    def enable_recording(self, fixture_dir):
+        """Live run that saves every HTTP exchange to fixture_dir (HTTP cache bypassed)."""
+        self._mount(RecordingAdapter(fixture_dir, pool_maxsize=self.max_workers))
+        self.logger.info(f"⏺ Recording HTTP fixtures to {fixture_dir}")
+
+    def enable_replay(self, fixture_dir, latency=0.0):
+        """Offline run served from fixture_dir, latency seconds added per request."""
+        self._mount(ReplayAdapter(fixture_dir, latency))
+        self.logger.info(f"⏯ Replaying HTTP fixtures from {fixture_dir} (latency {latency}s)")
+
     def fetch_initial_page(self):
-        """Load the first page and extract CSRF token."""
-        resp = self.session.get(self.SEARCH_URL, headers={"User-Agent": "Mozilla/5.0"})
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        token_elem = soup.select_one("input[name=csrfmiddlewaretoken]")
-        if token_elem:
-            self.csrf_token = token_elem["value"]
+        """Load the first page and extract CSRF token. Returns the page cards."""
+        with self.metrics.timer("page_fetch_seconds"):
+            resp = self.session.get(self.SEARCH_URL, headers={"User-Agent": "Mozilla/5.0"})
+            resp.raise_for_status()
+        with self.metrics.timer("card_extract_seconds"):
+            cards, token = self.extractor.parse_listing(resp.text)
+        if token:
+            self.csrf_token = token
             self.logger.info(f"CSRF token: {self.csrf_token}")
-        return resp.text
-
-    def fetch_page_html(self):
-        """Fetch initial page or next AJAX batch."""
-        if self.page == 1:
-            return self.fetch_initial_page()
+        return cards
 
+    def fetch_ajax_html(self, page):
+        """Fetch an AJAX batch after the initial page."""
         if not self.csrf_token:
             raise RuntimeError("CSRF token missing. Call fetch_initial_page() first.")
 
@@ -62,21 +243,43 @@ class DouJobScraper(BaseJobScraper):
             },
             data={
                 "csrfmiddlewaretoken": self.csrf_token,
-                "count": 20*self.page,
+                "count": 20*page,
             },
         )
         resp.raise_for_status()
         data = resp.json()  # parse JSON
         return data.get("html", "")  # return only the HTML string
 
+    def fetch_batch(self, page):
+        """Fetch initial page or AJAX batch and parse its cards once."""
+        self.metrics.observe("sleep_seconds", self.pacer.spend("page"), action="page")
+        started = time.monotonic()
+        if page == 1:
+            cards = self.fetch_initial_page()
+        else:
+            with self.metrics.timer("page_fetch_seconds"):
+                html = self.fetch_ajax_html(page)
+            self.pacer.observe(time.monotonic() - started)
+            with self.metrics.timer("card_extract_seconds"):
+                cards, _ = self.extractor.parse_listing(html)
+        self.metrics.inc("cards_total", len(cards))
+        return DouBatch(page, cards)
+
+    def prefetch_next_batch(self):
+        """Start fetching the next AJAX batch in the background."""
+        if self.PREFETCH and self._next_batch is None:
+            self._next_batch = self._prefetcher.submit(self.fetch_batch, self.page + 1)
+
     def go_to_next_page(self):
         """Fetch next batch of vacancies via AJAX."""
         self.page += 1
-        self.html = self.fetch_page_html()
-        soup = BeautifulSoup(self.html, "html.parser")
-        vacancies = soup.select(self.VACANCY_CART)
+        if self._next_batch is not None:
+            future, self._next_batch = self._next_batch, None
+            self.batch = future.result()
+        else:
+            self.batch = self.fetch_batch(self.page)
 
-        if not vacancies:
+        if not self.batch.cards:
             self.logger.info("No more vacancies returned from DOU.")
             return False
 
@@ -84,81 +287,39 @@ class DouJobScraper(BaseJobScraper):
     def fetch_full_description(self, job_url: str) -> str:
         """Fetch the full vacancy description from its page."""
         try:
-            resp = self.session.get(job_url, headers={"User-Agent": "Mozilla/5.0"})
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-            desc_elem = soup.select_one("div.b-typo.vacancy-section")
-            return desc_elem.get_text(" ", strip=True) if desc_elem else ""
+            with self.metrics.timer("detail_fetch_seconds"):
+                resp = self.session.get(job_url, headers={"User-Agent": "Mozilla/5.0"})
+                resp.raise_for_status()
+            return self.extractor.parse_description(resp.text)
         except Exception as e:
+            self.metrics.inc("detail_fetch_errors_total")
             self.logger.warning(f"⚠️ Failed to fetch full description for {job_url}: {e}")
             return ""
 
+    def fetch_descriptions(self, cards):
+        # Full description fetch: concurrently, results in card order; cards become Jobs
+        descriptions = [self.stored_description(card) for card in cards]
+        missing = [i for i, description in enumerate(descriptions) if description is None]
+        for i, description in zip(missing, self.fetcher.fetch_all(cards[i]["link"] for i in missing)):
+            descriptions[i] = description
+        return [self.card_to_job(card, description) for card, description in zip(cards, descriptions)]
+
     def scrape_jobs(self, existing_links):
-        jobs = []
-        if self.page == 1:
-            self.html = self.fetch_page_html()
-        # else: get html from go_to_next_page
+        if self.batch is None:
+            self.batch = self.fetch_batch(self.page)
+        # else: batch from go_to_next_page
         self.logger.info(f"🌍 Parsing page {self.page}")
-        soup = BeautifulSoup(self.html, "html.parser")
-        vacancies = soup.select(self.VACANCY_CART)
-        self.logger.info(f"Found {len(vacancies)} vacancies on page {self.page}")
+        cards = self.batch.cards
+        self.logger.info(f"Found {len(cards)} vacancies on page {self.page}")
 
-        if not vacancies:
+        if not cards:
             self.logger.info("✅ No more vacancies found.")
-            return jobs
-
-        for vac in vacancies:
-            title_elem = vac.select_one("div.title a.vt")
-            if not title_elem:
-                continue
-
-            link = title_elem["href"].split("?")[0] if title_elem else None
-            if link in self.seen_links:
-                continue
-            self.seen_links.add(link)
-
-            date = vac.select_one("div.date")
-            company_elem = vac.select_one("div.title a.company")
-            salary_elem = vac.select_one("div.title span.salary")
-            cities_elem = vac.select_one("div.title span.cities")
-            desc_elem = vac.select_one("div.sh-info")
-
-            title = title_elem.get_text(strip=True)
-            company_name = company_elem.get_text(strip=True) if company_elem else ""
-            salary = salary_elem.get_text(strip=True) if salary_elem else ""
-            location = cities_elem.get_text(strip=True) if cities_elem else ""
-            # short description
-            description_short = desc_elem.get_text(" ", strip=True) if desc_elem else ""
-            # Full description fetch
-            description = self.fetch_full_description(link)
-            date_text = date.get_text(strip=True) if date else ""
-
-            if not link or link in existing_links:
-                self.logger.info(f"⏭ Already processed: {title} @ {company_name}")
-                continue
-
-            # Filters
-            if not self.filters.job_matches_title(title):
-                self.logger.info(f"❌ {title} @ {company_name} : by title (skipped)")
-                continue
-
-            if not self.filters.job_matches_location(location):
-                self.logger.info(f"❌ {title} @ {company_name} : by location (skipped)")
-                continue
-
-            if not self.filters.job_matches(description):
-                continue
-
-            job = {
-                "title": title,
-                "company": company_name,
-                "location": location,
-                "date": date_text,
-                "salary": salary,				
-                "description": description,
-                "link": link,
-            }
-            jobs.append(job)
-            self.logger.info(f"✅ Match found: {title} @ {company_name}")
-
-        return (jobs, )
\ No newline at end of file
+            return
+
+        # next batch downloads while this one is filtered
+        self.prefetch_next_batch()
+
+        self.existing_links = existing_links
+        for job in self.pipeline.run(cards, self.metrics):
+            self.logger.info(f"✅ Match found: {job.title} @ {job.company} (score {job.score})")
+            yield MATCHED, job
@@ -0,0 +1,156 @@
+from bs4 import BeautifulSoup
+
+# lxml is optional: fast-path extractor and faster bs4 tree builder
+try:
+    import lxml.html
+    from lxml import etree
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml = None
+    HTML_PARSER = "html.parser"
+
+VACANCY_CARD = "li.l-vacancy, div.l-vacancy.__hot"
+VACANCY_DESCRIPTION = "div.b-typo.vacancy-section"
+
+
+def parse_html(html):
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+# -----------------------------------
+# EXTRACTORS
+# -----------------------------------
+# An extractor turns DOU HTML into plain data:
+#   parse_listing(html)     -> (cards, csrf_token or None)
+#   parse_description(html) -> full vacancy text
+# Cards are dicts: title, company, salary, location, description_short, date, link,
+# hot (pinned "hot" vacancy, not in newest-first order).
+class Bs4Extractor:
+    """Reference implementation on BeautifulSoup."""
+    name = "bs4"
+
+    def parse_listing(self, html):
+        soup = parse_html(html)
+        token_elem = soup.select_one("input[name=csrfmiddlewaretoken]")
+        csrf_token = token_elem["value"] if token_elem else None
+
+        cards = []
+        for vac in soup.select(VACANCY_CARD):
+            title_elem = vac.select_one("div.title a.vt")
+            if not title_elem:
+                continue
+
+            date = vac.select_one("div.date")
+            company_elem = vac.select_one("div.title a.company")
+            salary_elem = vac.select_one("div.title span.salary")
+            cities_elem = vac.select_one("div.title span.cities")
+            desc_elem = vac.select_one("div.sh-info")
+
+            cards.append({
+                "title": title_elem.get_text(strip=True),
+                "company": company_elem.get_text(strip=True) if company_elem else "",
+                "salary": salary_elem.get_text(strip=True) if salary_elem else "",
+                "location": cities_elem.get_text(strip=True) if cities_elem else "",
+                # short description
+                "description_short": desc_elem.get_text(" ", strip=True) if desc_elem else "",
+                "date": date.get_text(strip=True) if date else "",
+                "link": title_elem["href"].split("?")[0],
+                "hot": "__hot" in vac.get("class", []),
+            })
+        return cards, csrf_token
+
+    def parse_description(self, html):
+        desc_elem = parse_html(html).select_one(VACANCY_DESCRIPTION)
+        return desc_elem.get_text(" ", strip=True) if desc_elem else ""
+
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# text nodes as bs4 get_text sees them: script and style contents left out
+_TEXT_NODES = etree.XPath("descendant::text()[not(ancestor::script or ancestor::style)]") if lxml else None
+
+
+def _text(elem, sep=""):
+    """Same result as bs4 get_text(sep, strip=True)."""
+    if elem is None:
+        return ""
+    return sep.join(t.strip() for t in _TEXT_NODES(elem) if t.strip())
+
+
+class LxmlExtractor:
+    """Fast path: lxml tree + precompiled XPath for only the nodes we read."""
+    name = "lxml"
+
+    def __init__(self):
+        self._cards = etree.XPath(
+            f"//li[{_has_class('l-vacancy')}] | //div[{_has_class('l-vacancy')} and {_has_class('__hot')}]"
+        )
+        self._csrf = etree.XPath("//input[@name='csrfmiddlewaretoken']/@value")
+        self._title = etree.XPath(f".//div[{_has_class('title')}]//a[{_has_class('vt')}]")
+        self._company = etree.XPath(f".//div[{_has_class('title')}]//a[{_has_class('company')}]")
+        self._salary = etree.XPath(f".//div[{_has_class('title')}]//span[{_has_class('salary')}]")
+        self._cities = etree.XPath(f".//div[{_has_class('title')}]//span[{_has_class('cities')}]")
+        self._date = etree.XPath(f".//div[{_has_class('date')}]")
+        self._short = etree.XPath(f".//div[{_has_class('sh-info')}]")
+        self._description = etree.XPath(f"//div[{_has_class('b-typo')} and {_has_class('vacancy-section')}]")
+
+    @staticmethod
+    def _first(xpath, node):
+        found = xpath(node)
+        return found[0] if found else None
+
+    def parse_listing(self, html):
+        if not html.strip():
+            return [], None
+        root = lxml.html.fromstring(html)
+        token = self._csrf(root)
+
+        cards = []
+        for vac in self._cards(root):
+            title_elem = self._first(self._title, vac)
+            if title_elem is None:
+                continue
+            cards.append({
+                "title": _text(title_elem),
+                "company": _text(self._first(self._company, vac)),
+                "salary": _text(self._first(self._salary, vac)),
+                "location": _text(self._first(self._cities, vac)),
+                "description_short": _text(self._first(self._short, vac), " "),
+                "date": _text(self._first(self._date, vac)),
+                "link": (title_elem.get("href") or "").split("?")[0],
+                "hot": "__hot" in (vac.get("class") or "").split(),
+            })
+        return cards, (token[0] if token else None)
+
+    def parse_description(self, html):
+        if not html.strip():
+            return ""
+        return _text(self._first(self._description, lxml.html.fromstring(html)), " ")
+
+
+EXTRACTORS = {
+    Bs4Extractor.name: Bs4Extractor,
+    LxmlExtractor.name: LxmlExtractor,
+}
+
+
+def get_extractor(name=None):
+    """Extractor by name; default is lxml when installed, bs4 otherwise."""
+    if name is None:
+        name = "lxml" if lxml is not None else "bs4"
+    if name == "lxml" and lxml is None:
+        raise RuntimeError("lxml extractor requested but lxml is not installed")
+    return EXTRACTORS[name]()
+
+
+class DouBatch:
+    """One fetched listing page / AJAX batch, parsed once into card records."""
+
+    def __init__(self, page, cards):
+        self.page = page
+        self.cards = cards
+
+    def __len__(self):
+        return len(self.cards)
@@ -5,12 +5,89 @@ from selenium.webdriver.support.ui import WebDriverWait
 #from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium_stealth import stealth
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import os, re, time
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+import os, re, time, json
 
-from base_job_scraper import BaseJobScraper
+from base_job_scraper import BaseJobScraper, MATCHED, MATCHED_TITLE
 from utils.filters import Filters
-from utils.delays import human_delay
+from utils.delays import PacingScheduler
+from utils.job import Job
+from utils.request_blocking import RequestBlocker
+
+# -----------------------------------
+# CHROME (PROFILE + STEALTH), ONE OR SHARED BY SEVERAL SEARCHES
+# -----------------------------------
+def start_chrome(profile_dir, headless=False):
+    """Chrome on the persistent profile, with stealth applied."""
+    options = webdriver.ChromeOptions()
+    options.add_argument(f"--user-data-dir={profile_dir}")   # custom profile folder
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    else:
+        options.add_argument("--start-maximized")
+    # Network.* events for RequestBlocker's counters
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    driver = webdriver.Chrome(options=options)
+
+    # headless Chrome announces itself in the user agent
+    user_agent = driver.execute_script("return navigator.userAgent").replace("HeadlessChrome", "Chrome")
+
+    # Apply stealth mode
+    stealth(driver,
+            user_agent=user_agent,
+            languages=["en-US", "en"],
+            vendor="Google Inc.",
+            platform="Win32",
+            webgl_vendor="Intel Inc.",
+            renderer="Intel Iris OpenGL Engine",
+            fix_hairline=True,
+    )
+    return driver
+
+
+class BrowserSession:
+    """
+    One warm Chrome for a queue of searches.
+
+    Started by the first search that needs it; later searches only navigate
+    to their URL, so the profile (and the LinkedIn login in it) is loaded
+    once. A browser that died mid-run is restarted on the next start().
+    close() quits it at the end of the run.
+    """
+
+    def __init__(self, profile_dir, headless=False):
+        self.profile_dir = profile_dir
+        self.headless = headless
+        self.driver = None
+        # set once the user confirmed the login prompt; later searches skip it
+        self.logged_in = False
+
+    def _alive(self):
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def start(self):
+        """The running browser, (re)started if needed."""
+        if self.driver is None or not self._alive():
+            self.close()
+            self.driver = start_chrome(self.profile_dir, self.headless)
+        return self.driver
+
+    def close(self):
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+
 
 class LinkedInJobScraper(BaseJobScraper):
     # -----------------------------------
@@ -22,11 +99,105 @@ class LinkedInJobScraper(BaseJobScraper):
     # Chrome profile for persistent session
     PROFILE_DIR = os.path.join(os.getcwd(), "chrome_profile")
     XPATH_JOB_ELEMENTS = "//li[@data-occludable-job-id]"
+    NEEDS_LOGIN = True
+    # Results are relevance-ordered, so no watermark; stop on a page of known jobs
+    INCREMENTAL = {"watermark": False, "known_streak": 0, "known_page": True}
+
+    # One chromedriver round trip for all cards on the page (or one card by id).
+    # Cards LinkedIn has not rendered yet (occluded) come back with an empty title.
+    EXTRACT_CARDS_JS = """
+        const jobId = arguments[0];
+        const cards = jobId
+            ? document.querySelectorAll(`li[data-occludable-job-id="${jobId}"]`)
+            : document.querySelectorAll("li[data-occludable-job-id]");
+        const text = (root, sel) => {
+            const el = root.querySelector(sel);
+            return el ? el.innerText.trim() : "";
+        };
+        return JSON.stringify(Array.from(cards, li => {
+            const a = li.querySelector("a.job-card-list__title--link");
+            return {
+                id: li.getAttribute("data-occludable-job-id"),
+                title: a ? a.innerText.trim() : "",
+                href: a ? a.href : "",
+                company: text(li, "div[class*='artdeco-entity-lockup__subtitle']"),
+                location: text(li, "div[class*='artdeco-entity-lockup__caption'] li"),
+                viewed: text(li, "li.job-card-container__footer-job-state").includes("Viewed"),
+            };
+        }));
+    """
 
-    def __init__(self, filters, logger):
+    # Pacing: only opening a job and paging spend tokens; skipped cards are free.
+    # ~1 opened job per 8s with 2-5s jitter, close to the old 3-6s + 5-12s sleeps.
+    PACING = {
+        "rate": 0.125,
+        "burst": 1,
+        "costs": {"open_job": 1, "fetch_description": 0.25, "next_page": 1},
+        "jitter": (2, 5),
+        "slow_response": 8.0,
+    }
+
+    # Description source: "fetch" = in-browser fetch() of job pages, several at a
+    # time, with click as fallback per job; "click" = open each card and wait.
+    DESCRIPTION_SOURCE = "fetch"
+    FETCH_CONCURRENCY = 3
+    FETCH_TIMEOUT = 60
+    DESCRIPTION_SELECTORS = [
+        "div#job-details",
+        "div.jobs-description__content",
+        "div.jobs-box__html-content",
+        "div.show-more-less-html__markup",
+        "div.description__text",
+    ]
+    FETCH_DESCRIPTIONS_JS = """
+        const [urls, limit, selectors] = arguments;
+        const done = arguments[arguments.length - 1];
+        const results = new Array(urls.length).fill("");
+        let next = 0;
+        const worker = async () => {
+            while (next < urls.length) {
+                const i = next++;
+                try {
+                    const resp = await fetch(urls[i], {credentials: "include"});
+                    const doc = new DOMParser().parseFromString(await resp.text(), "text/html");
+                    for (const sel of selectors) {
+                        const el = doc.querySelector(sel);
+                        if (el && el.textContent.trim()) {
+                            results[i] = el.textContent.replace(/[ \\t]+/g, " ").replace(/\\s*\\n\\s*/g, "\\n").trim();
+                            break;
+                        }
+                    }
+                } catch (e) {
+                    results[i] = "";
+                }
+            }
+        };
+        Promise.all(Array.from({length: Math.min(limit, urls.length)}, worker))
+            .then(() => done(JSON.stringify(results)));
+    """
+
+    # Requests Chrome does not make (CDP Network.setBlockedURLs, * wildcards):
+    # the scraper reads only card text and the description.
+    BLOCKED_URLS = {
+        "images": ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.svg*", "*.ico*",
+                   "*media.licdn.com/dms/image/*"],
+        "fonts": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*"],
+        "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*dms.licdn.com/playlist/*"],
+        "tracking": ["*px.ads.linkedin.com/*", "*linkedin.com/li/track*", "*linkedin.com/realtime/*",
+                     "*doubleclick.net/*", "*google-analytics.com/*", "*googletagmanager.com/*",
+                     "*bat.bing.com/*", "*connect.facebook.net/*"],
+    }
+    # Groups of BLOCKED_URLS blocked by default
+    BLOCK = ("images", "fonts", "media", "tracking")
+
+    def __init__(self, filters, logger, pacing=None, block=None):
         self.driver = None
         self.filters = filters
         self.logger = logger
+        self.pacer = PacingScheduler({**self.PACING, **(pacing or {})}, logger)
+        # BLOCKED_URLS groups to block, () blocks nothing
+        self.block = self.BLOCK if block is None else block
+        self.blocker = None
     
     def get_logger(self):
         return self.logger
@@ -35,32 +206,44 @@ class LinkedInJobScraper(BaseJobScraper):
         self.SEARCH_URL = search_url
         self.logger.info(f"Search URL: {search_url}")
 
+    @classmethod
+    def open_session(cls, headless=False):
+        return BrowserSession(cls.PROFILE_DIR, headless)
+
     def setup_driver(self):
         # ----------------------------------
         # SETUP DRIVER (Selenium + Stealth)
         # -----------------------------------
-        options = webdriver.ChromeOptions()
-        options.add_argument(f"--user-data-dir={self.PROFILE_DIR}")   # custom profile folder
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--start-maximized")
-
-        self.driver = webdriver.Chrome(options=options)
-
-        # Apply stealth mode
-        stealth(self.driver,
-                languages=["en-US", "en"],
-                vendor="Google Inc.",
-                platform="Win32",
-                webgl_vendor="Intel Inc.",
-                renderer="Intel Iris OpenGL Engine",
-                fix_hairline=True,
-        )
-
+        if self.browser_session is not None:
+            # warm browser shared with the other searches of the run
+            self.driver = self.browser_session.start()
+        else:
+            self.driver = start_chrome(self.PROFILE_DIR)
+        self.install_blocker()
         self.driver.get(self.SEARCH_URL)
     
         return self.driver
 
+    def install_blocker(self):
+        patterns = [p for group in self.block for p in self.BLOCKED_URLS[group]]
+        if not patterns:
+            return
+        self.blocker = RequestBlocker(self.driver, patterns, self.logger)
+        try:
+            self.blocker.install()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Request blocking not available: {e}")
+            self.blocker = None
+
     def driver_quit(self):
+        self.pacer.report()
+        if self.blocker is not None:
+            self.blocker.collect()
+            self.blocker.record(self.metrics)
+            self.blocker.report()
+        if self.browser_session is not None:
+            # the session quits the browser after the last search
+            return
         self.logger.info(f"🔹 Browser session is kept in '{self.PROFILE_DIR}/' for next runs.")
         try:
             self.driver.quit()
@@ -87,135 +270,184 @@ class LinkedInJobScraper(BaseJobScraper):
             next_button = WebDriverWait(self.driver, timeout).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "button.jobs-search-pagination__button--next"))
             )
+            self.metrics.observe("sleep_seconds", self.pacer.spend("next_page"), action="next_page")
+            if self.blocker is not None:
+                # drain the performance log page by page
+                self.blocker.collect()
+            first_card = self.driver.find_elements(By.XPATH, self.XPATH_JOB_ELEMENTS)[:1]
+            started = time.monotonic()
             self.driver.execute_script("arguments[0].click();", next_button)  # safer than .click()
-            return True
         except (TimeoutException, NoSuchElementException):
             return False
 
-    def is_job_viewed(self, job_element) -> bool:
-        """
-        Returns True if the job card has the 'Viewed' footer.
-        """
-        try:
-            footer = job_element.find_element(
-                By.CSS_SELECTOR,
-                "li.job-card-container__footer-job-state"
-            )
-            return "Viewed" in footer.text.strip()
-        except:
-            return False
-
-    @staticmethod
-    def add_job(jobs_list, title, company_name, location, description, link):
-        """
-        Adds a job entry to the given list in a consistent format.
-    
-        Args:
-            jobs_list (list): The list to append the job to.
-            title (str): Job title.
-            company_name (str): Company name.
-            location (str): Job location.
-            link (str): URL to the job posting.
-            description (str, optional): Job description (default: "").
-        """
-        jobs_list.append({
-            "title": title,
-            "company": company_name,
-            "location": location,
-            "description": description,
-            "link": link
-        })
+        # cards are read in one call, so wait until the old list is replaced
+        if first_card:
+            try:
+                WebDriverWait(self.driver, 10).until(EC.staleness_of(first_card[0]))
+                self.pacer.observe(time.monotonic() - started)
+                self.metrics.observe("page_fetch_seconds", time.monotonic() - started)
+            except TimeoutException:
+                self.pacer.backoff("next page slow to load")
+        return True
 
     # -----------------------------------
     # SCRAPING
     # -----------------------------------
-    def scrape_jobs(self, existing_links):
-        jobs = []
-        jobs_matched_title = []
+    def extract_cards(self, job_id=None):
+        """All job cards (or the one with job_id) as dicts, in one execute_script call."""
+        cards = json.loads(self.driver.execute_script(self.EXTRACT_CARDS_JS, job_id))
+        for card in cards:
+            card["link"] = self.normalize_link(card["href"]) if card["href"] else ""
+        return cards
 
-        # Scroll to load all jobs on the first page
-        #load_all_jobs(driver)
+    def render_card(self, job_id, timeout=5):
+        """Scroll an occluded card into view and read it again once LinkedIn renders it."""
+        elem = self.driver.find_element(By.CSS_SELECTOR, f"li[data-occludable-job-id='{job_id}']")
+        self.driver.execute_script("arguments[0].scrollIntoView(true);", elem)
+        cards = WebDriverWait(self.driver, timeout).until(
+            lambda d: [c for c in self.extract_cards(job_id) if c["title"]]
+        )
+        return cards[0]
 
-        # Find all job cards
-        job_cards = self.driver.find_elements(By.XPATH, self.XPATH_JOB_ELEMENTS)
+    def open_card(self, job_id):
+        """Click the card title link to load its description."""
+        link_elem = self.driver.find_element(
+            By.CSS_SELECTOR, f"li[data-occludable-job-id='{job_id}'] a.job-card-list__title--link"
+        )
+        self.driver.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();", link_elem)
+
+    def scrape_jobs(self, existing_links):
+        if self.detect_captcha():
+            self.pacer.backoff("captcha")
+
+        # Read all job cards at once, decide in Python before touching any of them
+        with self.metrics.timer("card_extract_seconds"):
+            job_cards = self.extract_cards()
+        self.metrics.inc("cards_total", len(job_cards))
         # always check first - always it is opened when page is loaded
         check_first = True
+        # cards that passed the card-level checks, descriptions loaded after
+        to_open = []
     
         for i, card in enumerate(job_cards):
             try:
                 self.logger.info("-----------")
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", card)
-                human_delay(2, 4)
+                if not card["title"]:
+                    card = self.render_card(card["id"])
+
+                link = card["link"]
+                rejected = self.verdicts is not None and link in self.verdicts
+                if self.crawl is not None:
+                    self.crawl.observe(link, card["viewed"] or link in existing_links or rejected)
 
-                if not check_first and self.is_job_viewed(card):
+                if not check_first and card["viewed"]:
                     self.logger.info("⏭️ Skipping already viewed job")
                     continue  # skip this job
 
                 check_first = False
-
-                # find link element inside job card
-                link_elem = card.find_element(By.CSS_SELECTOR, "a.job-card-list__title--link")#"a.job-card-container__link"
-                link = self.normalize_link(link_elem.get_attribute("href"))
-                #title = link_elem.get_attribute("aria-label")
-                title = link_elem.text.strip()
-            
-                # company name
-                company_elem = card.find_element(By.XPATH, ".//div[contains(@class,'artdeco-entity-lockup__subtitle')]")#".artdeco-entity-lockup__subtitle span"
-                company_name = company_elem.text.strip()
+                title = card["title"]
+                company_name = card["company"]
 
                 self.logger.info(f"\n[{i+1}] {title} @ {company_name}")
                 self.logger.info(f"🔗 {link}")
 
                 if not self.filters.job_matches_title(title):
                     self.logger.info(f"[{i+1}] ❌ {title} @ {company_name} : by title (skipped)")
+                    if self.verdicts is not None:
+                        self.verdicts.add(link)
                     continue
 
                 # Location
-                location_elem = card.find_element(By.XPATH, ".//div[contains(@class,'artdeco-entity-lockup__caption')]//li")
-                location = location_elem.text.strip()
+                location = card["location"]
 
                 if not self.filters.job_matches_location(location):
                     self.logger.info(f"[{i+1}] ❌ {title} @ {company_name} : by location (skipped)")
-                    self.add_job(jobs_matched_title, title, company_name, location, "", link)
+                    yield MATCHED_TITLE, Job(title, company_name, location, link)
                     continue
 
                 if link in existing_links:
                     self.logger.info(f"[{i+1}] ⏭ Already reviewed: {title} @ {company_name}")
-                    self.add_job(jobs_matched_title, title, company_name, location, "", link)
+                    yield MATCHED_TITLE, Job(title, company_name, location, link)
+                    continue
+
+                if rejected:
+                    self.logger.info(f"[{i+1}] ⏭ Rejected earlier with the same filters: {title} @ {company_name}")
                     continue
 
-                # --- Click to open job ---
-                self.driver.execute_script("arguments[0].click();", link_elem)
-                #card.click()
-                human_delay(3, 6)
-            
-                # wait for description to appear
-                job_desc_elem = WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "div#job-details")))
-                description = job_desc_elem.text.strip()
+                card["index"] = i + 1
+                to_open.append(card)
+
+            except Exception as e:
+                self.logger.info(f"⚠️ Error reading job {i+1}: {e}")
+                continue
+
+        descriptions = {}
+        if self.DESCRIPTION_SOURCE == "fetch" and to_open:
+            descriptions = self.fetch_descriptions([card["link"] for card in to_open])
+
+        for card in to_open:
+            i, title, company_name = card["index"], card["title"], card["company"]
+            try:
+                description = descriptions.get(card["link"]) or self.click_description(card)
 
                 self.logger.info(f"📄 Description (first 200 chars): {description[:200]}...")
-                #time.sleep(3)
-
-                if self.filters.job_matches(description):
-                    jobs.append({
-                        "title": title,
-                        "company": company_name,
-						"location": location,
-                        "description": description,
-                        "link": link
-                    })
-                    self.logger.info(f"[{i+1}] ✅ {title} @ {company_name} (MATCHED)")
-                else:
-                    self.logger.info(f"[{i+1}] ❌ {title} @ {company_name} (skipped)")
-                    self.add_job(jobs_matched_title, title, company_name, location, description, link)
 
-                human_delay(5, 12)
+                job = Job(title, company_name, card["location"], card["link"], description)
+                if self.descriptions is not None and self.descriptions.mark_repost(job):
+                    self.logger.info(f"[{i}] ♻️ {title} @ {company_name} : same description as {job.repost_of}")
+                if self.filters.match_job(job):
+                    self.logger.info(f"[{i}] ✅ {title} @ {company_name} (MATCHED, score {job.score})")
+                    yield MATCHED, job
+                else:
+                    self.logger.info(f"[{i}] ❌ {title} @ {company_name} (skipped)")
+                    if self.verdicts is not None and description:
+                        self.verdicts.add(job.link)
+                    # only matched jobs keep a score in the file
+                    job.score = None
+                    yield MATCHED_TITLE, job
 
             except Exception as e:
-                self.logger.info(f"⚠️ Error reading job {i+1}: {e}")
+                self.logger.info(f"⚠️ Error reading job {i}: {e}")
                 continue
 
-        return (jobs, jobs_matched_title)
+    # -----------------------------------
+    # DESCRIPTIONS
+    # -----------------------------------
+    def click_description(self, card):
+        """Open the job in the side panel and read div#job-details."""
+        self.metrics.observe("sleep_seconds", self.pacer.spend("open_job"), action="open_job")
+        self.open_card(card["id"])
+        started = time.monotonic()
+
+        # wait for description to appear
+        job_desc_elem = WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "div#job-details")))
+        description = job_desc_elem.text.strip()
+        self.pacer.observe(time.monotonic() - started)
+        self.metrics.observe("detail_fetch_seconds", time.monotonic() - started, source="click")
+        return description
+
+    def fetch_descriptions(self, links):
+        """
+        Download job pages with fetch() inside the logged-in browser (same cookies),
+        at most FETCH_CONCURRENCY at a time. Returns {link: description}; links
+        whose description could not be found map to "" (use click_description).
+        """
+        self.metrics.observe("sleep_seconds", self.pacer.spend("fetch_description", count=len(links)),
+                             action="fetch_description")
+        self.driver.set_script_timeout(self.FETCH_TIMEOUT)
+        started = time.monotonic()
+        try:
+            texts = json.loads(self.driver.execute_async_script(
+                self.FETCH_DESCRIPTIONS_JS, links, self.FETCH_CONCURRENCY, self.DESCRIPTION_SELECTORS
+            ))
+        except Exception as e:
+            self.logger.info(f"⚠️ In-browser fetch failed, falling back to clicks: {e}")
+            return {}
+        self.pacer.observe((time.monotonic() - started) / max(1, len(links)))
+        self.metrics.observe("detail_fetch_seconds", time.monotonic() - started, source="fetch_batch")
+        found = sum(1 for text in texts if text)
+        self.logger.info(f"📥 Fetched {found}/{len(links)} descriptions in-browser")
+        return dict(zip(links, texts))
 
     def detect_captcha(self):
         """Check if a CAPTCHA is present"""
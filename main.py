@@ -1,53 +1,369 @@
-import argparse, sys
-from linkedin_job_scraper import LinkedInJobScraper
-from dou_job_scraper import DouJobScraper
+import argparse, sys, json, re, time, asyncio
+from concurrent.futures import ThreadPoolExecutor
+# scrapers (selenium, requests, bs4, httpx) are imported only once a site is selected
+from scraper_registry import SCRAPERS, LINKEDIN, DOU, find_scraper
 from utils.filters import Filters
-from utils.storage import Storage
-# from indeed_scraper import IndeedScraper  # future
+from utils.storage import Storage, JobWriter
+from utils.description_store import DescriptionStore
+from utils.metrics import Metrics, write_json_report, write_prometheus_textfile, profiled
+from utils.ranking import TopK
+from utils.watermark import Watermarks, IncrementalCrawl
+from base_job_scraper import SyncScraperAdapter, MATCHED, MATCHED_TITLE, PAGE_END
 
 from urllib.parse import urlsplit, urlunsplit
 
 from logger import LoggerHelper
 
-LINKEDIN = "Linkedin_job"
-DOU = "Dou_job"
-INDEED = "Indeed_job (soon)"
-SCRAPERS = {
-    "1": (LINKEDIN, LinkedInJobScraper),
-    "2": (DOU, DouJobScraper),
-    "3": (INDEED, None),
-}
+# Default filters, shared by all sites
+MUST_HAVE_TITLE = ["Test Automation", "Quality Assurance", "Quality Engineer", r"\bQA\b", r"\bAQA\b", "QA Automation", "QA Tester", "Test Engineer", "in Test", "SDET", "Testing", "Automation Engineer"]
+EXCLUDE_TITLE = ["Python", "C#", "iOS", "JavaScript"]
+MUST_HAVE_TEXT = [r"\bJava\b"]  # regex with word boundary
+OPTIONAL_TEXT = [r"\bJava\b", "Cucumber", r"\bSQL\b", "API", "Selenium", "TestNG", "TeamCity"]
 
-def run_scraper(scraper, filters, storage, logger):
+def build_filters(site_name, logger, overrides=None):
+    """
+    Default filters for the site. overrides: {"must_have_title": [...], ...},
+    each key is applied with the matching Filters.set_<key>().
+    """
+    filters = Filters(logger)
+    filters.set_must_have_title(MUST_HAVE_TITLE)
+    filters.set_exclude_title(EXCLUDE_TITLE)
+    filters.set_must_have_text(MUST_HAVE_TEXT)
+    filters.set_optional_text(OPTIONAL_TEXT)
+
+    # Site-specific filter setup
+    if site_name == LINKEDIN.lower():
+        filters.set_must_have_location(["Prague", r"Czechia \(Remote\)", r"European Union \(Remote\)"])
+    elif site_name == DOU.lower():
+        filters.set_must_have_location(["віддалено"])
+
+    for key, value in (overrides or {}).items():
+        getattr(filters, f"set_{key}")(value)
+    return filters
+
+def build_urls(site_name, url=None):
+    """(search_url, ajax_url) for the site, defaults when url is not given."""
+    if site_name == LINKEDIN.lower():
+        return url or "https://www.linkedin.com/jobs/collections/recommended/?discover=recommended", ""
+    if site_name == DOU.lower():
+        return url or "https://jobs.dou.ua/vacancies/?category=QA", createDouXhrLoadUrl(url) or "https://jobs.dou.ua/vacancies/xhr-load/?category=QA" #TODO need to use args.url properly
+    if url:
+        # registry plugins: no site defaults, the given url only
+        return url, ""
+    raise ValueError(f"Unknown site: {site_name}")
+
+def load_links(storage, compact_links=False):
+    """Known links per storage file: [existing_links, existing_links_matched_title]."""
+    return [st.load_existing_jobs(compact=compact_links) for st in storage]
+
+def open_writers(storage, links):
+    """One buffered JobWriter per tag: matched jobs and matched-title jobs."""
+    return {MATCHED: JobWriter(storage[0], links[0]), MATCHED_TITLE: JobWriter(storage[1], links[1])}
+
+def write_event(tag, job, writers, top):
+    """Store one streamed (tag, job) event."""
+    if writers[tag].add(job) and tag == MATCHED:
+        top.push(job)
+
+def flush_writers(writers):
+    for writer in writers.values():
+        writer.flush()
+
+def finish_run(storage, links, top, found, logger):
+    for st, known in zip(storage, links):
+        st.save_link_set(known)
+
+    logger.info(f"\n✅ Found {found} new jobs")
+    for rank, job in enumerate(top.best(), start=1):
+        logger.info(f"🏆 {rank}. [{job.score or 0}] {job.title} @ {job.company} {job.link}")
+
+def attach_run_state(scraper, filters, storage, links, incremental, metrics):
+    """
+    Give the scraper what it consults during a run: the IncrementalCrawl
+    (key: output file + search url; matched-title links count as known),
+    the DescriptionStore, the verdicts of the current filter rules and the
+    run Metrics. Returns the crawl.
+    """
+    crawl = IncrementalCrawl(Watermarks(), f"{storage[0].OUTPUT_FILE} {scraper.SEARCH_URL}",
+                             **scraper.INCREMENTAL, enabled=incremental, also_known=links[1])
+    scraper.crawl = crawl
+    scraper.descriptions = storage[0].descriptions
+    scraper.verdicts = storage[0].rejected_jobs(filters.config_hash())
+    scraper.metrics = filters.metrics = metrics
+    for st in storage:
+        st.metrics = metrics
+    return crawl
+
+def run_summary(writers, pages, started, metrics):
+    """Counters of a finished run; the Metrics object rides along for export."""
+    seconds = time.monotonic() - started
+    found = writers[MATCHED].written
+    matched_title = writers[MATCHED_TITLE].written
+    metrics.inc("pages_total", pages)
+    metrics.inc("jobs_total", found, tag=MATCHED)
+    metrics.inc("jobs_total", matched_title, tag=MATCHED_TITLE)
+    metrics.inc("run_seconds_total", seconds)
+    return {"found": found, "matched_title": matched_title, "pages": pages,
+            "seconds": round(seconds, 1), "metrics": metrics}
+
+def crawl_done(crawl, logger):
+    """End of a page; True when the rest of the listing is already known."""
+    crawl.end_page()
+    if crawl.should_stop():
+        logger.info(f"🛑 Stopping early: {crawl.reason()} (use -full to crawl everything)")
+        return True
+    return False
+
+def run_scraper(scraper, filters, storage, logger, top_n=0, compact_links=False, interactive=True, incremental=True):
+    started = time.monotonic()
     driver = scraper.setup_driver()
 
-    input("👉 Log in if needed and press Enter...")
-
-    existing_links = storage[0].load_existing_jobs()
-    if len(storage)>1:
-        existing_links_matched_title = storage[1].load_existing_jobs()
-    all_jobs = []
-    while True:
-        new_jobs = scraper.scrape_jobs(existing_links)
-        storage[0].save_jobs_to_file(new_jobs[0], existing_links)
-        existing_links.update({job["link"] for job in new_jobs[0]})
-        all_jobs.extend(new_jobs[0])
-        if len(new_jobs)>1:
-            # Filter out already-known jobs
-            new_jobs_skipped = [
-                job for job in new_jobs[1] if job["link"] not in existing_links_matched_title
-            ]
-            # Add new links to existing_links_matched_title
-            storage[1].save_jobs_to_file(new_jobs_skipped, existing_links_matched_title)
-            existing_links_matched_title.update({job["link"] for job in new_jobs_skipped})
-        if not scraper.go_to_next_page():
-            break
-
-    logger.info(f"\n✅ Found {len(all_jobs)} new jobs")
+    session = scraper.browser_session
+    if interactive and scraper.NEEDS_LOGIN and not (session and session.logged_in):
+        input("👉 Log in if needed and press Enter...")
+        if session is not None:
+            session.logged_in = True
+
+    links = load_links(storage, compact_links)
+    metrics = Metrics()
+    crawl = attach_run_state(scraper, filters, storage, links, incremental, metrics)
+    writers = open_writers(storage, links)
+    pages = 0
+    top = TopK(top_n)
+    try:
+        while True:
+            pages += 1
+            for tag, job in scraper.scrape_jobs(links[0]):
+                write_event(tag, job, writers, top)
+            flush_writers(writers)
+            if crawl_done(crawl, logger):
+                break
+            if not scraper.go_to_next_page():
+                break
+    finally:
+        # keep what was scraped before a crash
+        flush_writers(writers)
+
+    finish_run(storage, links, top, writers[MATCHED].written, logger)
+    crawl.commit()
 
     # Cleanup driver
     scraper.driver_quit()
 
+    return run_summary(writers, pages, started, metrics)
+
+async def run_scraper_async(scraper, filters, storage, logger, top_n=0, compact_links=False, incremental=True):
+    """run_scraper for an AsyncBaseJobScraper; storage writes go to a worker thread."""
+    started = time.monotonic()
+    loop = asyncio.get_running_loop()
+    links = await loop.run_in_executor(None, load_links, storage, compact_links)
+    metrics = Metrics()
+    crawl = attach_run_state(scraper, filters, storage, links, incremental, metrics)
+    writers = open_writers(storage, links)
+    pages = 0
+    top = TopK(top_n)
+    try:
+        events = scraper.iter_events(links[0])
+        async for tag, job in events:
+            if tag != PAGE_END:
+                await loop.run_in_executor(None, write_event, tag, job, writers, top)
+                continue
+            pages += 1
+            await loop.run_in_executor(None, flush_writers, writers)
+            if crawl_done(crawl, logger):
+                await events.aclose()
+                break
+        await loop.run_in_executor(None, flush_writers, writers)
+        await loop.run_in_executor(None, finish_run, storage, links, top, writers[MATCHED].written, logger)
+        await loop.run_in_executor(None, crawl.commit)
+    finally:
+        await loop.run_in_executor(None, flush_writers, writers)
+        await scraper.aclose()
+
+    return run_summary(writers, pages, started, metrics)
+
+# -----------------------------------
+# MULTI-SEARCH RUN (-config)
+# -----------------------------------
+# {
+#   "workers": 4,
+#   "compact_links": false,
+#   "full": false,             (true: ignore watermarks, crawl every page; also per search)
+#   "store_descriptions": false, (true: full texts in descriptions.sqlite, flag re-posts)
+#   "headless": false,         (true: browser searches in a headless Chrome)
+#   "searches": [
+#     {"name": "dou_qa_remote", "site": "Dou_job", "url": "https://jobs.dou.ua/vacancies/?category=QA",
+#      "filters": {"must_have_location": ["віддалено"]}},
+#     {"name": "linkedin_prague", "site": "Linkedin_job", "url": "https://www.linkedin.com/jobs/search/?..."}
+#   ]
+# }
+# Browser scrapers (NEEDS_LOGIN) run one after another in the main thread, in
+# one warm browser per site, HTTP scrapers run meanwhile in a worker pool.
+# Each search writes to its own <name>.txt / <name>_matched_title.txt.
+def prepare_search(search, descriptions=None):
+    """Logger, filters, urls and storage pair for one -config search."""
+    spec = find_scraper(search["site"])
+    site, scraper_cls = spec.site, spec.load()
+    site_name = site.lower()
+    name = search.get("name") or site_name
+    logger = LoggerHelper.get_logger(name)
+    filters = build_filters(site_name, logger, search.get("filters"))
+    urls = build_urls(site_name, search.get("url"))
+    storage = (Storage(logger, f"{name}.txt", descriptions=descriptions),
+               Storage(logger, f"{name}_matched_title.txt", descriptions=descriptions))
+    return name, site, scraper_cls, logger, filters, urls, storage
+
+def open_sessions(searches, headless=False):
+    """One shared browser session per site that has one (see BaseJobScraper.open_session)."""
+    sessions = {}
+    for search in searches:
+        spec = find_scraper(search["site"])
+        if spec.site not in sessions:
+            sessions[spec.site] = spec.load().open_session(headless)
+    return sessions
+
+def close_sessions(sessions):
+    for session in sessions.values():
+        if session is not None:
+            session.close()
+
+def run_search(search, compact_links=False, interactive=False, full=False, descriptions=None, session=None):
+    site = find_scraper(search["site"]).site
+    summary = {"name": search.get("name") or site.lower(), "site": site}
+    scraper = None
+    try:
+        name, site, scraper_cls, logger, filters, urls, storage = prepare_search(search, descriptions)
+        scraper = scraper_cls(filters, logger)
+        scraper.browser_session = session
+        scraper.init_url(*urls)
+        summary.update(run_scraper(scraper, filters, storage, logger,
+                                   top_n=search.get("top", 0), compact_links=compact_links,
+                                   interactive=interactive, incremental=not search.get("full", full)))
+    except Exception as e:
+        summary["error"] = f"{type(e).__name__}: {e}"
+        if scraper is not None:
+            scraper.driver_quit()
+    return summary
+
+async def run_search_async(search, browser_lock, compact_links=False, full=False, descriptions=None,
+                           session=None):
+    spec = find_scraper(search["site"])
+    site = spec.site
+    summary = {"name": search.get("name") or site.lower(), "site": site}
+    try:
+        name, site, scraper_cls, logger, filters, urls, storage = prepare_search(search, descriptions)
+        # native async implementation if registered, else the sync one via SyncScraperAdapter
+        async_cls = spec.load_async()
+        if async_cls is not None:
+            scraper = async_cls(filters, logger)
+        else:
+            sync_scraper = scraper_cls(filters, logger)
+            sync_scraper.browser_session = session
+            scraper = SyncScraperAdapter(sync_scraper)
+        scraper.init_url(*urls)
+        run = run_scraper_async(scraper, filters, storage, logger, search.get("top", 0), compact_links,
+                                incremental=not search.get("full", full))
+        if scraper.NEEDS_LOGIN:
+            # one browser profile: browser searches take turns
+            async with browser_lock:
+                summary.update(await run)
+        else:
+            summary.update(await run)
+    except Exception as e:
+        summary["error"] = f"{type(e).__name__}: {e}"
+    return summary
+
+def validate_config(config):
+    """Return a list of problems in a -config file (empty if OK)."""
+    problems = []
+    names = set()
+    for i, search in enumerate(config.get("searches", [])):
+        found = find_scraper(search.get("site", ""))
+        if not found or not found.implemented:
+            problems.append(f"searches[{i}]: unknown or not implemented site {search.get('site')!r}")
+            continue
+        name = search.get("name") or found.site.lower()
+        if name in names:
+            problems.append(f"searches[{i}]: duplicate name {name!r} (set a unique \"name\")")
+        names.add(name)
+        for key in search.get("filters", {}):
+            if not hasattr(Filters, f"set_{key}"):
+                problems.append(f"searches[{i}]: unknown filter {key!r}")
+    if not config.get("searches"):
+        problems.append("no searches")
+    return problems
+
+def open_descriptions(enabled):
+    """Shared DescriptionStore for all searches of the run, or None."""
+    return DescriptionStore() if enabled else None
+
+def run_config(config, interactive=False, full=False, store_descriptions=False, headless=False):
+    searches = config["searches"]
+    compact_links = config.get("compact_links", False)
+    full = full or config.get("full", False)
+    descriptions = open_descriptions(store_descriptions or config.get("store_descriptions", False))
+    browser = [s for s in searches if find_scraper(s["site"]).load().NEEDS_LOGIN]
+    http = [s for s in searches if not find_scraper(s["site"]).load().NEEDS_LOGIN]
+    sessions = open_sessions(browser, headless or config.get("headless", False))
+
+    started = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=config.get("workers", 4)) as pool:
+            futures = [pool.submit(run_search, s, compact_links, False, full, descriptions) for s in http]
+            summaries = [run_search(s, compact_links, interactive, full, descriptions,
+                                    sessions[find_scraper(s["site"]).site]) for s in browser]
+            summaries += [f.result() for f in futures]
+    finally:
+        close_sessions(sessions)
+
+    print_summary(summaries, started)
+    return summaries
+
+async def run_config_async(config, full=False, store_descriptions=False, headless=False):
+    """Like run_config, but all searches share one event loop (-async)."""
+    compact_links = config.get("compact_links", False)
+    full = full or config.get("full", False)
+    descriptions = open_descriptions(store_descriptions or config.get("store_descriptions", False))
+    sessions = open_sessions(config["searches"], headless or config.get("headless", False))
+    browser_lock = asyncio.Lock()
+    started = time.monotonic()
+    try:
+        summaries = await asyncio.gather(*(
+            run_search_async(s, browser_lock, compact_links, full, descriptions, sessions[find_scraper(s["site"]).site])
+            for s in config["searches"]
+        ))
+    finally:
+        # quit() may block on chromedriver
+        await asyncio.get_running_loop().run_in_executor(None, close_sessions, sessions)
+    print_summary(summaries, started)
+    return summaries
+
+def print_summary(summaries, started):
+    print(f"\n{'search':<30} {'site':<14} {'new':>5} {'title':>6} {'pages':>6} {'time,s':>8}")
+    for s in summaries:
+        if "error" in s:
+            print(f"{s['name']:<30} {s['site']:<14} ❌ {s['error']}")
+        else:
+            print(f"{s['name']:<30} {s['site']:<14} {s['found']:>5} {s['matched_title']:>6} {s['pages']:>6} {s['seconds']:>8}")
+    print(f"Total: {sum(s.get('found', 0) for s in summaries)} new jobs in {time.monotonic() - started:.1f}s")
+
+def export_metrics(summaries, json_path=None, prometheus_path=None):
+    """-metrics / -prometheus outputs for finished searches."""
+    if json_path:
+        write_json_report(json_path, summaries)
+    if prometheus_path:
+        write_prometheus_textfile(prometheus_path, summaries)
+
+def split_search_url(value):
+    """-url value: 'NAME=URL' -> (NAME, URL), a plain URL -> (None, URL)."""
+    if value is None:
+        return None, None
+    name, sep, url = value.partition("=")
+    if sep and re.fullmatch(r"[\w-]+", name):
+        return name, url
+    return None, value
+
+
 def createDouXhrLoadUrl(url):
     if url == None:
         return ""
@@ -67,63 +383,159 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Job Scraper CLI")
     parser.add_argument(
         "-choice",
-        choices=[LINKEDIN, DOU, INDEED],
+        choices=[spec.site for spec in SCRAPERS.values()],
         help="Choose which scraper to use",
     )
     parser.add_argument(
         "-url",
-        help="Base search URL to scrape",
+        action="append",
+        help="Base search URL to scrape; repeat for several searches in one run, NAME=URL names "
+             "the output files (NAME.txt)",
+    )
+    parser.add_argument(
+        "-headless",
+        action="store_true",
+        help="Run browser searches in a headless Chrome (log in once without it first)",
+    )
+    parser.add_argument(
+        "-top",
+        type=int,
+        default=0,
+        help="Show the N best-scored new matches at the end of the run",
+    )
+    parser.add_argument(
+        "-compact-links",
+        action="store_true",
+        help="Keep known links as numeric ids (less memory for long histories)",
+    )
+    parser.add_argument(
+        "-full",
+        action="store_true",
+        help="Crawl all pages (backfill) instead of stopping at jobs known from the last run",
+    )
+    parser.add_argument(
+        "-store-descriptions",
+        action="store_true",
+        help="Keep full descriptions once in descriptions.sqlite (compressed) and flag re-posted vacancies",
+    )
+    parser.add_argument(
+        "-record",
+        metavar="DIR",
+        help="DOU: save all HTTP responses to DIR for offline replay",
+    )
+    parser.add_argument(
+        "-replay",
+        metavar="DIR",
+        help="DOU: serve HTTP responses from DIR recorded with -record (no network)",
+    )
+    parser.add_argument(
+        "-replay-latency",
+        type=float,
+        default=0.0,
+        help="Seconds of latency added to each replayed response",
+    )
+    parser.add_argument(
+        "-config",
+        metavar="FILE",
+        help="JSON file with several searches to run without prompts (see run_config)",
+    )
+    parser.add_argument(
+        "-async",
+        dest="use_async",
+        action="store_true",
+        help="With -config: run all searches in one asyncio event loop",
+    )
+    parser.add_argument(
+        "-login-prompt",
+        action="store_true",
+        help="With -config: wait for Enter before browser searches (to log in)",
+    )
+    parser.add_argument(
+        "-metrics",
+        metavar="FILE",
+        help="Write a JSON run report (counters and timing histograms per search) to FILE",
+    )
+    parser.add_argument(
+        "-prometheus",
+        metavar="FILE",
+        help="Write run metrics as a Prometheus textfile (node_exporter textfile collector)",
+    )
+    parser.add_argument(
+        "-profile",
+        metavar="FILE",
+        nargs="?",
+        const="profile.pstats",
+        help="Run under cProfile, save stats to FILE (default profile.pstats) and print the top functions",
     )
     args = parser.parse_args()
 
-    # --- interactive fallback if no choice ---
-    if not args.choice:
-        print("Choose site:")
-        for key, (name, _) in SCRAPERS.items():
-            print(f"{key}. {name}")
-
-        choice = input("Enter choice: ")
-        scraper_info = SCRAPERS.get(choice)
-    else:
-        scraper_info = None
-        for _, (name, scraper_cls) in SCRAPERS.items():
-            if name == args.choice:
-                scraper_info = (name, scraper_cls)
-                break
-        else:
-            print(f"Incorrect choice: {args.choice}")
+    with profiled(args.profile):
+        if args.config:
+            with open(args.config, encoding="utf-8") as f:
+                config = json.load(f)
+            problems = validate_config(config)
+            if problems:
+                print("\n".join(f"❌ {p}" for p in problems))
+                sys.exit(1)
+            if args.use_async:
+                summaries = asyncio.run(run_config_async(config, full=args.full,
+                                                         store_descriptions=args.store_descriptions,
+                                                         headless=args.headless))
+            else:
+                summaries = run_config(config, interactive=args.login_prompt, full=args.full,
+                                       store_descriptions=args.store_descriptions, headless=args.headless)
+            export_metrics(summaries, args.metrics, args.prometheus)
             sys.exit()
 
-    if scraper_info and scraper_info[1]:
-        site_name = scraper_info[0].lower()
-        logger = LoggerHelper.get_logger(scraper_info[0].lower())
-
-        MUST_HAVE_TITLE = ["Test Automation", "Quality Assurance", "Quality Engineer", r"\bQA\b", r"\bAQA\b", "QA Automation", "QA Tester", "Test Engineer", "in Test", "SDET", "Testing", "Automation Engineer"]
-        EXCLUDE_TITLE = ["Python", "C#", "iOS", "JavaScript"]
-        MUST_HAVE_TEXT = [r"\bJava\b"]  # regex with word boundary
-        OPTIONAL_TEXT = [r"\bJava\b", "Cucumber", r"\bSQL\b", "API", "Selenium", "TestNG", "TeamCity"]
-
-        filters = Filters(logger)
-        filters.set_must_have_title(MUST_HAVE_TITLE)
-        filters.set_exclude_title(EXCLUDE_TITLE)
-        filters.set_must_have_text(MUST_HAVE_TEXT)
-        filters.set_optional_text(OPTIONAL_TEXT)
-
-        # Site-specific filter setup
-        if site_name == LINKEDIN.lower():
-            filters.set_must_have_location(["Prague", r"Czechia \(Remote\)", r"European Union \(Remote\)"])
-            search_url = args.url or "https://www.linkedin.com/jobs/collections/recommended/?discover=recommended"
-            ajax_url = ""
-        elif site_name == DOU.lower():
-            filters.set_must_have_location(["віддалено"])
-            search_url = args.url or "https://jobs.dou.ua/vacancies/?category=QA"
-            ajax_url = createDouXhrLoadUrl(args.url) or "https://jobs.dou.ua/vacancies/xhr-load/?category=QA" #TODO need to use args.url properly
+        # --- interactive fallback if no choice ---
+        if not args.choice:
+            print("Choose site:")
+            for key, spec in SCRAPERS.items():
+                print(f"{key}. {spec.label}")
+
+            choice = input("Enter choice: ")
+            spec = SCRAPERS.get(choice)
         else:
-            sys.exit()
+            spec = find_scraper(args.choice)
+            if spec is None:
+                print(f"Incorrect choice: {args.choice}")
+                sys.exit()
+
+        if spec and spec.implemented:
+            scraper_cls = spec.load()
+            site_name = spec.site.lower()
+            searches = [split_search_url(url) for url in args.url or [None]]
+            descriptions = open_descriptions(args.store_descriptions)
+            # several -url: one after another, in one warm browser for browser sites
+            session = scraper_cls.open_session(args.headless)
+            summaries = []
+            started = time.monotonic()
+            try:
+                for i, (name, url) in enumerate(searches, start=1):
+                    name = name or (site_name if len(searches) == 1 else f"{site_name}_{i}")
+                    logger = LoggerHelper.get_logger(name)
 
-        storage = (Storage(logger, f"{site_name}.txt"), Storage(logger, f"{site_name}_matched_title.txt"))
-        scraper = scraper_info[1](filters, logger)
-        scraper.init_url(search_url, ajax_url)
-        run_scraper(scraper, filters, storage, logger)
-    else:
-        print("❌ Not implemented yet")
\ No newline at end of file
+                    filters = build_filters(site_name, logger)
+                    search_url, ajax_url = build_urls(site_name, url)
+
+                    storage = (Storage(logger, f"{name}.txt", descriptions=descriptions),
+                               Storage(logger, f"{name}_matched_title.txt", descriptions=descriptions))
+                    scraper = scraper_cls(filters, logger)
+                    scraper.browser_session = session
+                    scraper.init_url(search_url, ajax_url)
+                    if site_name == DOU.lower():
+                        if args.record:
+                            scraper.enable_recording(args.record)
+                        elif args.replay:
+                            scraper.enable_replay(args.replay, args.replay_latency)
+                    summary = run_scraper(scraper, filters, storage, logger, top_n=args.top,
+                                          compact_links=args.compact_links, incremental=not args.full)
+                    summaries.append({"name": name, "site": spec.site, **summary})
+            finally:
+                if session is not None:
+                    session.close()
+            if len(summaries) > 1:
+                print_summary(summaries, started)
+            export_metrics(summaries, args.metrics, args.prometheus)
+        else:
+            print("❌ Not implemented yet")
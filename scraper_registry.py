@@ -0,0 +1,99 @@
+import importlib
+from importlib.metadata import entry_points
+
+# -----------------------------------
+# SCRAPER REGISTRY (IMPORTED ON FIRST USE)
+# -----------------------------------
+LINKEDIN = "Linkedin_job"
+DOU = "Dou_job"
+INDEED = "Indeed_job"
+
+# Scrapers from other packages, e.g. in their pyproject.toml:
+#   [project.entry-points."job_scraper.scrapers"]
+#   Indeed_job = "indeed_scraper:IndeedScraper"
+# An entry point named like a built-in site replaces it.
+ENTRY_POINT_GROUP = "job_scraper.scrapers"
+
+
+class ScraperSpec:
+    """
+    A site and where its scraper lives, as "module:Class" (or an entry point).
+
+    Nothing is imported until load(): listing sites, --help and config
+    validation never pull in selenium, requests or bs4. async_target is an
+    optional native AsyncBaseJobScraper for -config -async.
+    """
+
+    def __init__(self, site, target=None, async_target=None):
+        self.site = site
+        self.target = target
+        self.async_target = async_target
+        self._cls = None
+        self._async_cls = None
+
+    @property
+    def implemented(self):
+        return self.target is not None
+
+    @property
+    def label(self):
+        return self.site if self.implemented else f"{self.site} (soon)"
+
+    @staticmethod
+    def _import(target):
+        if not isinstance(target, str):
+            # importlib.metadata.EntryPoint
+            return target.load()
+        module, _, name = target.partition(":")
+        return getattr(importlib.import_module(module), name)
+
+    def load(self):
+        """The scraper class; its module (and dependencies) is imported on first call."""
+        if self._cls is None:
+            if self.target is None:
+                raise NotImplementedError(f"{self.site} scraper is not implemented yet")
+            self._cls = self._import(self.target)
+        return self._cls
+
+    def load_async(self):
+        """Native async scraper class, or None (none registered, or its optional deps are missing)."""
+        if self._async_cls is None and self.async_target is not None:
+            try:
+                self._async_cls = self._import(self.async_target)
+            except ImportError:
+                # e.g. httpx not installed: the sync scraper runs via SyncScraperAdapter
+                self.async_target = None
+        return self._async_cls
+
+
+BUILTIN_SCRAPERS = [
+    ScraperSpec(LINKEDIN, "linkedin_job_scraper:LinkedInJobScraper"),
+    ScraperSpec(DOU, "dou_job_scraper:DouJobScraper", "async_dou_job_scraper:AsyncDouJobScraper"),
+    ScraperSpec(INDEED),  # not implemented: register "indeed_scraper:IndeedScraper" here or via an entry point
+]
+
+
+def _entry_points():
+    try:
+        return entry_points(group=ENTRY_POINT_GROUP)
+    except Exception:
+        return ()
+
+
+def load_registry():
+    """Menu number -> ScraperSpec: built-in sites, then entry-point plugins."""
+    specs = {spec.site.lower(): spec for spec in BUILTIN_SCRAPERS}
+    for ep in _entry_points():
+        specs[ep.name.lower()] = ScraperSpec(ep.name, ep)
+    return {str(i): spec for i, spec in enumerate(specs.values(), start=1)}
+
+
+SCRAPERS = load_registry()
+
+
+def find_scraper(name):
+    """ScraperSpec for a site name like 'Dou_job', or None."""
+    for spec in SCRAPERS.values():
+        if spec.site.lower() == name.lower():
+            return spec
+    return None
@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+from dou_parser import get_extractor, lxml
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "benchmarks", "fixtures")
+
+pytestmark = pytest.mark.skipif(lxml is None, reason="lxml not installed")
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_listing_same_as_bs4():
+    html = read_fixture("dou_listing.html")
+    assert get_extractor("lxml").parse_listing(html) == get_extractor("bs4").parse_listing(html)
+
+
+def test_description_same_as_bs4():
+    # the description section holds a <script> and a <style>: neither is vacancy text
+    html = read_fixture("dou_vacancy.html")
+    text = get_extractor("lxml").parse_description(html)
+    assert "<script>" in html and "dataLayer" not in text
+    assert text == get_extractor("bs4").parse_description(html)
@@ -1,8 +1,111 @@
-import random, time
+import random, threading, time
 
 # -----------------------------------
 # HUMAN-LIKE DELAYS
 # -----------------------------------
 def human_delay(a=2, b=5):
     """Random sleep to look less like a bot"""
-    time.sleep(random.uniform(a, b))
\ No newline at end of file
+    time.sleep(random.uniform(a, b))
+
+
+# -----------------------------------
+# ADAPTIVE PACING (TOKEN BUCKET)
+# -----------------------------------
+# PacingScheduler.shared() instances by key
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+class PacingScheduler:
+    """
+    Paces actions that touch the site; everything else costs nothing.
+
+    A token bucket refills at `rate` tokens/sec up to `burst`. spend(action)
+    takes `costs[action]` tokens (times the current slowdown), sleeping only
+    when the bucket is short, plus a random `jitter`. backoff() (captcha,
+    slow responses seen by observe()) multiplies the slowdown up to
+    `max_slowdown`; normal responses let it decay back to 1.
+    """
+    DEFAULT_POLICY = {
+        "rate": 0.25,               # tokens per second
+        "burst": 2,                 # bucket capacity
+        "costs": {},                # action -> tokens, default 1
+        "jitter": (0.0, 0.0),       # extra random sleep per spend, seconds
+        "backoff_factor": 2.0,
+        "max_slowdown": 8.0,
+        "recover": 0.9,             # slowdown multiplier after a normal response
+        "slow_response": 5.0,       # seconds; slower responses trigger backoff
+    }
+
+    def __init__(self, policy=None, logger=None):
+        self.policy = {**self.DEFAULT_POLICY, **(policy or {})}
+        self.logger = logger
+        self.tokens = float(self.policy["burst"])
+        self.slowdown = 1.0
+        self.slept = 0.0
+        self.spent = {}
+        self.backoffs = 0
+        self.started = time.monotonic()
+        self._refilled = self.started
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, key, policy=None, logger=None):
+        """
+        One scheduler per key (e.g. a site's host) for the whole process, so
+        searches running in parallel on one site share its budget. The
+        first caller's policy is used.
+        """
+        with _shared_lock:
+            if key not in _shared:
+                _shared[key] = cls(policy, logger)
+            return _shared[key]
+
+    def _refill(self, now):
+        self.tokens = min(self.policy["burst"], self.tokens + (now - self._refilled) * self.policy["rate"])
+        self._refilled = now
+
+    def spend(self, action, count=1):
+        """Wait until `action` (repeated `count` times) may run; returns the seconds slept."""
+        cost = self.policy["costs"].get(action, 1) * count * self.slowdown
+        with self._lock:
+            self._refill(time.monotonic())
+            # reserve now; a negative balance is the debt we sleep off
+            self.tokens -= cost
+            wait = -self.tokens / self.policy["rate"] if self.tokens < 0 else 0.0
+            wait += random.uniform(*self.policy["jitter"])
+            self.spent[action] = self.spent.get(action, 0) + count
+            self.slept += wait
+        if wait > 0:
+            time.sleep(wait)
+        return max(wait, 0.0)
+
+    def backoff(self, reason=""):
+        with self._lock:
+            self.slowdown = min(self.slowdown * self.policy["backoff_factor"], self.policy["max_slowdown"])
+            self.backoffs += 1
+        if self.logger:
+            self.logger.info(f"🐢 Backing off ({reason}): slowdown x{self.slowdown:.1f}")
+
+    def observe(self, seconds):
+        """Feed a response time; slow ones back off, normal ones recover."""
+        if seconds > self.policy["slow_response"]:
+            self.backoff(f"slow response {seconds:.1f}s")
+        else:
+            with self._lock:
+                self.slowdown = max(1.0, self.slowdown * self.policy["recover"])
+
+    def report(self):
+        elapsed = time.monotonic() - self.started
+        stats = {
+            "sleeping": round(self.slept, 2),
+            "working": round(max(0.0, elapsed - self.slept), 2),
+            "actions": dict(self.spent),
+            "backoffs": self.backoffs,
+        }
+        if self.logger:
+            self.logger.info(
+                f"⏱ Pacing: slept {stats['sleeping']}s, worked {stats['working']}s, "
+                f"actions {stats['actions']}, backoffs {stats['backoffs']}"
+            )
+        return stats
@@ -0,0 +1,165 @@
+import sqlite3, threading, zlib
+from array import array
+from hashlib import blake2b
+
+from utils.near_dup import MinHash, NearDuplicateIndex, normalize_text
+
+# zstandard is optional: better ratio and speed than zlib when installed
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def text_hash(text):
+    """Content address of a description: hash of its normalized text."""
+    return blake2b(normalize_text(text).encode(), digest_size=16).hexdigest()
+
+
+def summary_key(*parts):
+    """Key of what a listing shows before the detail page (e.g. title, company, summary)."""
+    return text_hash("\n".join(parts))
+
+
+# -----------------------------------
+# CONTENT-ADDRESSED DESCRIPTION STORE
+# -----------------------------------
+class DescriptionStore:
+    """
+    Compressed job descriptions stored once per distinct (normalized) text.
+
+    One SQLite file shared by all searches:
+      blobs      hash -> compressed text (codec "zstd" or "zlib")
+      signatures hash -> MinHash signature, for near-duplicate lookups
+      aliases    summary key -> hash, to recognize a re-posted vacancy from
+                 its listing card, before fetching the detail page
+      links      saved link -> hash
+    A description seen again is a re-post only under a different link: the
+    same vacancy found by another search sharing the file is not one.
+    Safe to share between threads.
+    """
+    FILE = "descriptions.sqlite"
+    ZLIB_LEVEL = 6
+    ZSTD_LEVEL = 10
+
+    def __init__(self, path=None, threshold=0.8):
+        self.path = path or self.FILE
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.minhash = MinHash()
+        self.threshold = threshold
+        self._near = None
+        self._lock = threading.Lock()
+        self._zstd_c = zstandard.ZstdCompressor(level=self.ZSTD_LEVEL) if zstandard else None
+        self._zstd_d = zstandard.ZstdDecompressor() if zstandard else None
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS blobs (hash TEXT PRIMARY KEY, codec TEXT, data BLOB)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS signatures (hash TEXT PRIMARY KEY, sig BLOB)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS aliases (key TEXT PRIMARY KEY, hash TEXT)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS links (link TEXT PRIMARY KEY, hash TEXT)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS links_hash ON links (hash)")
+
+    # -----------------------------------
+    # BLOBS
+    # -----------------------------------
+    def _compress(self, text):
+        data = text.encode("utf-8")
+        if self._zstd_c is not None:
+            return "zstd", self._zstd_c.compress(data)
+        return "zlib", zlib.compress(data, self.ZLIB_LEVEL)
+
+    def _decompress(self, codec, data):
+        if codec == "zstd":
+            if self._zstd_d is None:
+                raise RuntimeError(f"{self.path} has zstd blobs but zstandard is not installed")
+            return self._zstd_d.decompress(data).decode("utf-8")
+        return zlib.decompress(data).decode("utf-8")
+
+    def put(self, text):
+        """Store text (once per content), return its hash."""
+        key = text_hash(text)
+        with self._lock:
+            if self.conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (key,)).fetchone():
+                return key
+            codec, data = self._compress(text)
+            signature = self.minhash.signature(text)
+            with self.conn:
+                self.conn.execute("INSERT INTO blobs (hash, codec, data) VALUES (?, ?, ?)", (key, codec, data))
+                if signature is not None:
+                    self.conn.execute("INSERT OR REPLACE INTO signatures (hash, sig) VALUES (?, ?)",
+                                      (key, signature.tobytes()))
+            if self._near is not None:
+                self._near.add(key, signature)
+        return key
+
+    def get(self, key):
+        with self._lock:
+            row = self.conn.execute("SELECT codec, data FROM blobs WHERE hash = ?", (key,)).fetchone()
+        return self._decompress(*row) if row else ""
+
+    def loader(self, key):
+        """Zero-argument callable for a lazy Job.description."""
+        return lambda: self.get(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (key,)).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+
+    # -----------------------------------
+    # RE-POST DETECTION
+    # -----------------------------------
+    def add_alias(self, key, description_hash):
+        with self._lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO aliases (key, hash) VALUES (?, ?)", (key, description_hash))
+
+    def add_link(self, link, description_hash):
+        with self._lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO links (link, hash) VALUES (?, ?)", (link, description_hash))
+
+    def other_link(self, description_hash, link):
+        """A saved link other than `link` with this description, or None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT link FROM links WHERE hash = ? AND link != ? LIMIT 1", (description_hash, link)
+            ).fetchone()
+        return row[0] if row else None
+
+    def find_alias(self, key):
+        """Description hash stored for a listing summary key, or None."""
+        with self._lock:
+            row = self.conn.execute("SELECT hash FROM aliases WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _near_index(self):
+        # built on first use from the stored signatures
+        if self._near is None:
+            near = NearDuplicateIndex(self.minhash.num_perm, threshold=self.threshold)
+            for key, sig in self.conn.execute("SELECT hash, sig FROM signatures"):
+                near.add(key, array("Q", sig))
+            self._near = near
+        return self._near
+
+    def find_duplicate(self, text):
+        """Hash of a stored description equal or nearly equal to text, or None."""
+        key = text_hash(text)
+        if key in self:
+            return key
+        signature = self.minhash.signature(text)
+        with self._lock:
+            return self._near_index().query(signature)
+
+    def mark_repost(self, job):
+        """
+        Set job.repost_of to a saved link other than job.link whose description
+        (nearly) equals job's, and return it (None: not a re-post).
+        """
+        description = job.description
+        key = self.find_duplicate(description) if description else None
+        job.repost_of = self.other_link(key, job.link) if key is not None else None
+        return job.repost_of
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,90 @@
+import asyncio, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# -----------------------------------
+# PER-HOST RATE LIMIT
+# -----------------------------------
+# next free request slot per host, shared by every limiter in the process:
+# parallel searches on one site split its budget instead of multiplying it
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+
+def _reserve_slot(url, interval):
+    """Reserve the next request slot for url's host; returns (slot, now)."""
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        now = time.monotonic()
+        slot = max(now, _host_slots.get(host, now))
+        _host_slots[host] = slot + interval
+    return slot, now
+
+
+class HostRateLimiter:
+    """Spaces requests to the same host at least 1/rate seconds apart (across all limiters)."""
+
+    def __init__(self, rate=2.0):
+        self.interval = 1.0 / rate if rate else 0.0
+
+    def wait(self, url):
+        if not self.interval:
+            return
+        # reserve a slot under the lock, sleep outside of it
+        slot, now = _reserve_slot(url, self.interval)
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class AsyncHostRateLimiter:
+    """HostRateLimiter for coroutines; shares the per-host slots with it."""
+
+    def __init__(self, rate=2.0):
+        self.interval = 1.0 / rate if rate else 0.0
+
+    async def wait(self, url):
+        if not self.interval:
+            return
+        slot, now = _reserve_slot(url, self.interval)
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+# -----------------------------------
+# BOUNDED-PARALLEL FETCHER
+# -----------------------------------
+class ConcurrentFetcher:
+    """
+    Runs `fetch(url)` for many urls on a thread pool.
+
+    At most `max_workers` requests are in flight and each host is limited
+    to `rate_per_host` requests per second. Results keep the input order.
+    Urls for which `skip_wait(url)` is true (e.g. fresh cache entries, that
+    never reach the host) are fetched without waiting for a slot.
+    """
+
+    def __init__(self, fetch, max_workers=4, rate_per_host=2.0, skip_wait=None):
+        self.fetch = fetch
+        self.max_workers = max_workers
+        self.limiter = HostRateLimiter(rate_per_host)
+        self.skip_wait = skip_wait
+        self._pool = None
+
+    def _fetch_one(self, url):
+        if self.skip_wait is None or not self.skip_wait(url):
+            self.limiter.wait(url)
+        return self.fetch(url)
+
+    def fetch_all(self, urls):
+        """Fetch all urls, return results in the same order as urls."""
+        urls = list(urls)
+        if not urls:
+            return []
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return list(self._pool.map(self._fetch_one, urls))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
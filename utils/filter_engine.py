@@ -0,0 +1,95 @@
+import re
+
+# chars re.IGNORECASE treats as equal that str.lower() keeps apart (from re's case tables)
+FOLD = str.maketrans({
+    "\u0131": "i", "\u017f": "s", "\u03b9": "\u0345", "\u03bc": "\u00b5", "\u03c3": "\u03c2",
+    "\u03d0": "\u03b2", "\u03d1": "\u03b8", "\u03d5": "\u03c6", "\u03d6": "\u03c0", "\u03f0": "\u03ba",
+    "\u03f1": "\u03c1", "\u03f5": "\u03b5", "\u1c80": "\u0432", "\u1c81": "\u0434", "\u1c82": "\u043e",
+    "\u1c83": "\u0441", "\u1c84": "\u0442", "\u1c85": "\u0442", "\u1c86": "\u044a", "\u1c87": "\u0463",
+    "\u1e9b": "\u1e61", "\u1fbe": "\u0345", "\u1fd3": "\u0390", "\u1fe3": "\u03b0", "\ua64b": "\u1c88",
+    "\ufb06": "\ufb05",
+})
+# unescaped, these make a pattern more than a literal
+REGEX_META = set(".^$*+?{}[]|()\\")
+
+
+def fold(text):
+    """Loose case folding: every re.IGNORECASE match survives it as a plain substring."""
+    return text.replace("İ", "i").lower().translate(FOLD)
+
+
+def literal_core(pattern):
+    """
+    The plain text every match of pattern contains, or None.
+
+    Handles literals with escaped punctuation and optional \\b anchors,
+    e.g. r"\\bJava\\b" -> "Java", r"Czechia \\(Remote\\)" -> "Czechia (Remote)".
+    """
+    core = pattern
+    while core.startswith(r"\b"):
+        core = core[2:]
+    while core.endswith(r"\b") and not core.endswith(r"\\b"):
+        core = core[:-2]
+    chars, i = [], 0
+    while i < len(core):
+        c = core[i]
+        if c == "\\":
+            if i + 1 >= len(core) or core[i + 1].isalnum():
+                return None  # \d, \s, \b inside, ...
+            c = core[i + 1]
+            i += 1
+        elif c in REGEX_META:
+            return None
+        chars.append(c)
+        i += 1
+    return "".join(chars) or None
+
+
+# -----------------------------------
+# PRECOMPILED RULE MATCHING
+# -----------------------------------
+class CompiledFilterEngine:
+    """
+    Matches named rule groups (lists of regexes) against a text.
+
+    Every pattern is compiled once, case-insensitive; a pattern shared by
+    several groups is compiled once. Groups are checked pattern by pattern
+    and stop at the first hit, like the original re.search loops.
+
+    Patterns that are a literal (optionally \\b-anchored) are first looked
+    up with a substring test on the folded text, and their regex runs only
+    when the literal is there, so absent keywords cost a fast C search
+    instead of a case-insensitive regex scan.
+    """
+
+    def __init__(self, groups):
+        compiled = {}
+        self.groups = {}
+        for name, patterns in groups.items():
+            self.groups[name] = []
+            for pattern in patterns:
+                if pattern not in compiled:
+                    core = literal_core(pattern)
+                    compiled[pattern] = (re.compile(pattern, re.IGNORECASE), fold(core) if core else None)
+                self.groups[name].append((pattern, *compiled[pattern]))
+        self._folded = (None, None)  # (text, fold(text)) of the last text
+
+    def _fold(self, text):
+        last, folded = self._folded
+        if last is not text:
+            folded = fold(text)
+            self._folded = (text, folded)
+        return folded
+
+    def _search(self, regex, core, text):
+        if core is not None and core not in self._fold(text):
+            return False
+        return regex.search(text) is not None
+
+    def has(self, name, text):
+        """True if any pattern of group `name` is found in text (stops at the first)."""
+        return any(self._search(regex, core, text) for _, regex, core in self.groups.get(name, ()))
+
+    def found(self, name, text):
+        """Patterns of group `name` found in text, in rule order (checks all of them)."""
+        return [pattern for pattern, regex, core in self.groups.get(name, ()) if self._search(regex, core, text)]
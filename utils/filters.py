@@ -1,4 +1,7 @@
-import re
+import hashlib, json
+
+from utils.filter_engine import CompiledFilterEngine
+from utils.metrics import NO_METRICS
 
 class Filters:
 
@@ -6,68 +9,124 @@ class Filters:
     MUST_HAVE_TITLE = ["Test Automation", "Quality Assurance", r"\bQA\b", r"\bAQA\b", "QA Automation", "Automation Test Engineer", "in Test"]
     EXCLUDE_TITLE = ["Python", "C#", "iOS"]
     MUST_HAVE_TEXT = [r"\bJava\b"]  # regex with word boundary
-    OPTIONAL_TEXT = [r"\bJava\b", "Cucumber", r"\bSQL\b", "API", "Selenium", "TestNG", "TeamCity"] # TODO: to count score
+    OPTIONAL_TEXT = [r"\bJava\b", "Cucumber", r"\bSQL\b", "API", "Selenium", "TestNG", "TeamCity"]
     EXCLUDE_TEXT = []
     MUST_HAVE_LOCATION = []
+    # Score weight per OPTIONAL_TEXT pattern, missing patterns weigh 1
+    OPTIONAL_WEIGHTS = {}
+
+    # Rule groups scanned together, per checked field
+    FIELD_GROUPS = {
+        "title": ("MUST_HAVE_TITLE", "EXCLUDE_TITLE"),
+        "location": ("MUST_HAVE_LOCATION",),
+        "text": ("MUST_HAVE_TEXT", "OPTIONAL_TEXT", "EXCLUDE_TEXT"),
+    }
 
     def __init__(self, logger):
         self.logger = logger
+        self._engines = {}
+        # utils.metrics.Metrics of the current run (set by run_scraper)
+        self.metrics = NO_METRICS
 
     def set_must_have_title(self, arr):
         self.MUST_HAVE_TITLE = arr
+        self.invalidate()
 
     def set_exclude_title(self, arr):
         self.EXCLUDE_TITLE = arr
+        self.invalidate()
 
     def set_must_have_text(self, arr):
         self.MUST_HAVE_TEXT = arr
+        self.invalidate()
 
     def set_optional_text(self, arr):
         self.OPTIONAL_TEXT = arr
+        self.invalidate()
 
     def set_exclude_text(self, arr):
         self.EXCLUDE_TEXT = arr
+        self.invalidate()
 
     def set_must_have_location(self, arr):
         self.MUST_HAVE_LOCATION = arr
+        self.invalidate()
+
+    def set_optional_weights(self, weights):
+        self.OPTIONAL_WEIGHTS = weights
+
+    # -----------------------------------
+    # COMPILED RULES
+    # -----------------------------------
+    def invalidate(self):
+        """Drop compiled rules, they are rebuilt on next match."""
+        self._engines = {}
+
+    def config_hash(self):
+        """Short hash of all rules; results cached under it are void once a rule changes."""
+        rules = {name: list(getattr(self, name)) for names in self.FIELD_GROUPS.values() for name in names}
+        return hashlib.sha1(json.dumps(rules, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+
+    def engine(self, field):
+        engine = self._engines.get(field)
+        if engine is None:
+            engine = CompiledFilterEngine({name: getattr(self, name) for name in self.FIELD_GROUPS[field]})
+            self._engines[field] = engine
+        return engine
         
     # -----------------------------------
     # JOB FILTER FUNCTION
     # -----------------------------------
-    def job_matches_title(self, title: str) -> bool:
-        text = title.lower()
+    def _count(self, field, matched):
+        self.metrics.inc("filter_checks_total", field=field)
+        if not matched:
+            self.metrics.inc("filter_rejected_total", field=field)
+        return matched
 
-        # must have any
-        if not any(re.search(k, text, re.IGNORECASE) for k in self.MUST_HAVE_TITLE):
-            return False
-
-        # exclude words
-        if any(re.search(k, text, re.IGNORECASE) for k in self.EXCLUDE_TITLE):
-            return False
+    def job_matches_title(self, title: str) -> bool:
+        engine = self.engine("title")
+        with self.metrics.timer("filter_seconds", field="title"):
+            # must have any, exclude words
+            matched = engine.has("MUST_HAVE_TITLE", title) and not engine.has("EXCLUDE_TITLE", title)
+        return self._count("title", matched)
 
-        return True
     def job_matches_location(self, location: str) -> bool:
-        text = location.lower()
+        with self.metrics.timer("filter_seconds", field="location"):
+            matched = self.engine("location").has("MUST_HAVE_LOCATION", location)
+        return self._count("location", matched)
 
-        if not any(re.search(k, text, re.IGNORECASE) for k in self.MUST_HAVE_LOCATION):
-            return False
-
-        return True
     def job_matches(self, description: str) -> bool:
-        text = description.lower()
-
-        if not any(re.search(k, text, re.IGNORECASE) for k in self.MUST_HAVE_TEXT):
-            self.logger.info(f"Not matched MUST_HAVE: {self.MUST_HAVE_TEXT}")
-            return False
-
-        # must have at least one optional
-        if not any(re.search(k, text, re.IGNORECASE) for k in self.OPTIONAL_TEXT):
-            self.logger.info(f"Not matched OPTIONAL: {self.OPTIONAL_TEXT}")
-            return False
-
-        # exclude words
-        if any(re.search(k, text, re.IGNORECASE) for k in self.EXCLUDE_TEXT):
-            self.logger.info(f"Not matched due to EXCLUDE: {self.EXCLUDE_TEXT}")
-            return False
-
-        return True
\ No newline at end of file
+        return self.match_text(description)[0]
+
+    def match_job(self, job) -> bool:
+        """match_text on a Job's description; stores the score on the job."""
+        matched, job.score = self.match_text(job.description)
+        return self._count("text", matched)
+
+    def match_text(self, description: str):
+        """
+        Returns (matched, score). Score is the summed weight of the distinct
+        OPTIONAL_TEXT keywords found, each checked on its own; it is 0 when
+        the text already fails MUST_HAVE_TEXT (optional keywords not scanned).
+        """
+        engine = self.engine("text")
+        with self.metrics.timer("filter_seconds", field="text"):
+            # stops at the first must-have keyword found
+            if not engine.has("MUST_HAVE_TEXT", description):
+                self.logger.info(f"Not matched MUST_HAVE: {self.MUST_HAVE_TEXT}")
+                return False, 0
+
+            found = dict.fromkeys(engine.found("OPTIONAL_TEXT", description))
+            score = sum(self.OPTIONAL_WEIGHTS.get(k, 1) for k in found)
+
+            # must have at least one optional
+            if not found:
+                self.logger.info(f"Not matched OPTIONAL: {self.OPTIONAL_TEXT}")
+                return False, score
+
+            # exclude words, stops at the first one found
+            if engine.has("EXCLUDE_TEXT", description):
+                self.logger.info(f"Not matched due to EXCLUDE: {self.EXCLUDE_TEXT}")
+                return False, score
+
+        return True, score
@@ -0,0 +1,156 @@
+import json, re, sqlite3, threading, time
+from collections import namedtuple
+
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from utils.replay import build_response
+
+CachedResponse = namedtuple("CachedResponse", "status headers body stored_at")
+
+# -----------------------------------
+# ON-DISK HTTP CACHE (TTL + LRU + REVALIDATION)
+# -----------------------------------
+class HttpCache:
+    """
+    GET responses kept in one SQLite file, keyed by url.
+
+    Entries younger than `ttl` seconds are served without a request; older
+    ones are revalidated with If-None-Match / If-Modified-Since (a 304 makes
+    them fresh again). Once the stored bodies exceed `max_bytes`, the least
+    recently used entries are dropped.
+    """
+    FILE = "http_cache.sqlite"
+    # headers that describe the stored (decoded) body or the old transfer
+    SKIP_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection", "set-cookie"}
+
+    def __init__(self, path=None, ttl=24 * 3600, max_bytes=200 * 1024 * 1024):
+        self.path = path or self.FILE
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # several scrapers (threads) may share the file
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._lock = threading.Lock()
+        self.hits = self.revalidated = self.downloaded = 0
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, status INTEGER, headers TEXT, "
+                "body BLOB, size INTEGER, stored_at REAL, used_at REAL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS responses_used ON responses (used_at)")
+        self._total = self._stored_bytes()
+
+    def _stored_bytes(self):
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, url):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT status, headers, body, stored_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            with self.conn:
+                self.conn.execute("UPDATE responses SET used_at = ? WHERE url = ?", (time.time(), url))
+        return CachedResponse(row[0], json.loads(row[1]), row[2], row[3])
+
+    def is_fresh(self, entry):
+        return time.time() - entry.stored_at < self.ttl
+
+    def has_fresh(self, url):
+        """True if url would be served from the cache without a request."""
+        with self._lock:
+            row = self.conn.execute("SELECT stored_at FROM responses WHERE url = ?", (url,)).fetchone()
+        return row is not None and time.time() - row[0] < self.ttl
+
+    @staticmethod
+    def validators(entry):
+        """Conditional request headers for a stale entry."""
+        headers = {k.lower(): v for k, v in entry.headers.items()}
+        conditional = {}
+        if "etag" in headers:
+            conditional["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            conditional["If-Modified-Since"] = headers["last-modified"]
+        return conditional
+
+    def put(self, url, status, headers, body):
+        headers = {k: v for k, v in headers.items() if k.lower() not in self.SKIP_HEADERS}
+        now = time.time()
+        with self._lock:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO responses (url, status, headers, body, size, stored_at, used_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (url, status, json.dumps(headers), body, len(body), now, now),
+                )
+            self.downloaded += 1
+            self._total += len(body)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def refresh(self, url):
+        """Server answered 304: the stored entry is fresh again."""
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE responses SET stored_at = ? WHERE url = ?", (time.time(), url))
+            self.revalidated += 1
+
+    def _evict(self):
+        # other connections may have written too: recount first
+        self._total = self._stored_bytes()
+        with self.conn:
+            while self._total > self.max_bytes:
+                rows = self.conn.execute("SELECT url, size FROM responses ORDER BY used_at LIMIT 100").fetchall()
+                if not rows:
+                    break
+                for url, size in rows:
+                    self.conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                    self._total -= size
+                    if self._total <= self.max_bytes:
+                        break
+
+    def report(self, logger):
+        logger.info(
+            f"🗄 HTTP cache: {self.hits} fresh hits, {self.revalidated} revalidated (304), "
+            f"{self.downloaded} downloaded"
+        )
+
+    def close(self):
+        self.conn.close()
+
+
+class CachingAdapter(HTTPAdapter):
+    """requests transport that answers GETs of urls matching `match` through an HttpCache."""
+
+    def __init__(self, cache, match=None, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.match = re.compile(match) if isinstance(match, str) else match
+
+    def _cached(self, request, entry):
+        return build_response(self, request, entry.status, "OK", entry.headers, entry.body,
+                              get_encoding_from_headers(CaseInsensitiveDict(entry.headers)))
+
+    def served_locally(self, url):
+        """True if a GET of url would be answered from the cache, without a request."""
+        return (self.match is None or self.match.search(url) is not None) and self.cache.has_fresh(url)
+
+    def send(self, request, **kwargs):
+        if request.method != "GET" or (self.match is not None and not self.match.search(request.url)):
+            return super().send(request, **kwargs)
+
+        entry = self.cache.get(request.url)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.hits += 1
+            return self._cached(request, entry)
+        if entry is not None:
+            request.headers.update(self.cache.validators(entry))
+
+        resp = super().send(request, **kwargs)
+        if resp.status_code == 304 and entry is not None:
+            self.cache.refresh(request.url)
+            return self._cached(request, entry)
+        if resp.status_code == 200:
+            self.cache.put(request.url, resp.status_code, dict(resp.headers), resp.content)
+        return resp
@@ -0,0 +1,48 @@
+import sys
+
+from utils.link_set import link_id
+
+# -----------------------------------
+# JOB RECORD
+# -----------------------------------
+class Job:
+    """
+    One scraped job, shared by all scrapers, Filters and Storage.
+
+    Slotted (no per-instance dict). company, location and date repeat across
+    many jobs and are interned. job_id is the numeric id from the link (None
+    for unknown link formats). description is either the text or a
+    zero-argument callable that loads it (e.g. from an on-disk blob); it is
+    resolved on every access and never cached on the record. summary_key
+    identifies what the listing showed before the detail page (see
+    utils.description_store), when the site has such a summary. repost_of
+    is the saved link whose description this job repeats, if any.
+    """
+    __slots__ = ("title", "company", "location", "salary", "date", "link", "score", "job_id", "summary_key",
+                 "repost_of", "_description")
+
+    def __init__(self, title="", company="", location="", link="", description="", salary="", date="", score=None,
+                 summary_key=None, repost_of=None):
+        self.title = title
+        self.company = sys.intern(company or "")
+        self.location = sys.intern(location or "")
+        self.salary = salary
+        self.date = sys.intern(date or "")
+        self.link = link
+        self.score = score
+        self.job_id = link_id(link)
+        self.summary_key = summary_key
+        self.repost_of = repost_of
+        self._description = description
+
+    @property
+    def description(self):
+        text = self._description
+        return text() if callable(text) else text
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+
+    def __repr__(self):
+        return f"Job({self.title!r} @ {self.company!r}, {self.link!r})"
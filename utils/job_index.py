@@ -0,0 +1,95 @@
+import sqlite3, time
+
+# -----------------------------------
+# LINK INDEX (SQLITE SIDECAR)
+# -----------------------------------
+class JobIndex:
+    """
+    Compact index of saved job links, kept beside a Storage text file.
+
+    The text file stays the human-readable record; startup only reads the
+    keys from here. `text_size` remembers the text file size after our last
+    write, so a file edited or replaced by hand is detected and re-indexed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # one Storage uses it at a time, but maybe not from the thread that opened it
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS jobs (link TEXT PRIMARY KEY)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            # jobs whose description failed the text filters, per filter config hash
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS rejected (link TEXT, config TEXT, seen_at REAL, PRIMARY KEY (link, config))"
+            )
+
+    def get_meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def is_in_sync(self, text_size):
+        return self.get_meta("text_size") == str(text_size)
+
+    def links(self):
+        return {row[0] for row in self.conn.execute("SELECT link FROM jobs")}
+
+    def __contains__(self, link):
+        return self.conn.execute("SELECT 1 FROM jobs WHERE link = ?", (link,)).fetchone() is not None
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def add_links(self, links, text_size):
+        """Add links and record the new text file size in one transaction."""
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO jobs (link) VALUES (?)", ((l,) for l in links))
+            self._set_meta("text_size", text_size)
+
+    def rebuild(self, links, text_size):
+        """Replace the whole index, e.g. when migrating an existing text file."""
+        with self.conn:
+            self.conn.execute("DELETE FROM jobs")
+            self.conn.executemany("INSERT OR IGNORE INTO jobs (link) VALUES (?)", ((l,) for l in links))
+            self._set_meta("text_size", text_size)
+
+    def rejected_links(self, config):
+        return {row[0] for row in self.conn.execute("SELECT link FROM rejected WHERE config = ?", (config,))}
+
+    def add_rejected(self, link, config):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO rejected (link, config, seen_at) VALUES (?, ?, ?)",
+                              (link, config, time.time()))
+
+    def close(self):
+        self.conn.close()
+
+
+class RejectedJobs:
+    """
+    Jobs already rejected by the filters (title, location or text) under one
+    filter configuration.
+
+    They count as known for early stopping, and scrapers skip them (no
+    detail fetch, no filtering) until the rules change,
+    which changes Filters.config_hash() and starts a new, empty verdict set.
+    """
+
+    def __init__(self, index, config):
+        self.index = index
+        self.config = config
+        self._links = index.rejected_links(config)
+
+    def __contains__(self, link):
+        return link in self._links
+
+    def __len__(self):
+        return len(self._links)
+
+    def add(self, link):
+        if link and link not in self._links:
+            self._links.add(link)
+            self.index.add_rejected(link, self.config)
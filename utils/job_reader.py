@@ -0,0 +1,64 @@
+import re
+
+# -----------------------------------
+# STREAMING READER FOR STORAGE TEXT FILES
+# -----------------------------------
+# Format written by Storage.save_jobs_to_file:
+#   1. ----------------------------
+#    title=...
+#    ...
+#    link=...
+#   <blank line>
+# Values may span several lines (LinkedIn titles and descriptions keep their
+# newlines), so any line that is not a block start or a known key continues
+# the previous value. With a DescriptionStore, description holds a preview and
+# description_hash points at the full text; repost_of is the saved link of a
+# job with the same description.
+BLOCK_START = re.compile(r"^\d+\. -+$")
+FIELD_LINE = re.compile(r"^ (title|company|location|salary|date|score|description|description_hash|repost_of|link)=(.*)$", re.DOTALL)
+
+
+def iter_job_records(path, fields=None):
+    """
+    Yield one dict per job block, reading the file line by line.
+
+    fields: optional collection of keys to keep. Other values (e.g. long
+    descriptions) are skipped without being accumulated.
+    """
+    record, key, lines = None, None, []
+
+    def finish():
+        if key is not None and (fields is None or key in fields):
+            record[key] = "\n".join(lines).rstrip("\n")
+
+    with open(path, encoding="utf-8", newline="") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if BLOCK_START.match(line):
+                if record is not None:
+                    finish()
+                    yield record
+                record, key, lines = {}, None, []
+                continue
+            if record is None:
+                continue  # text before the first block
+
+            m = FIELD_LINE.match(line)
+            if m:
+                finish()
+                key = m.group(1)
+                lines = [m.group(2)] if fields is None or key in fields else []
+            elif key is not None and (fields is None or key in fields):
+                lines.append(line)
+
+    if record is not None:
+        finish()
+        yield record
+
+
+def iter_links(path):
+    """Yield saved job links without materializing descriptions."""
+    for record in iter_job_records(path, fields=("link",)):
+        link = record.get("link", "").strip()
+        if link:
+            yield link
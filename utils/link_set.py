@@ -0,0 +1,133 @@
+import os, re, struct
+from array import array
+from bisect import bisect_left
+from heapq import merge
+
+# -----------------------------------
+# COMPACT SEEN-LINK SET
+# -----------------------------------
+# LinkedIn: https://www.linkedin.com/jobs/view/<id>/
+# DOU:      https://jobs.dou.ua/companies/<company>/vacancies/<id>/
+LINK_ID_PATTERNS = [
+    re.compile(r"linkedin\.com/jobs/view/(\d+)"),
+    re.compile(r"jobs\.dou\.ua/companies/[^/]+/vacancies/(\d+)"),
+]
+
+def link_id(link):
+    """Numeric job id parsed from a known job link, or None."""
+    if not link:
+        return None
+    for pattern in LINK_ID_PATTERNS:
+        m = pattern.search(link)
+        if m:
+            return int(m.group(1))
+    return None
+
+
+class CompactLinkSet:
+    """
+    Set-like membership for job links, 8 bytes per known job.
+
+    Links with a numeric id are kept as a sorted array('q') of ids plus a
+    small set of recent additions, merged in once it reaches MERGE_AT or
+    1/MERGE_FRACTION of the array (so merges get rarer as the set grows).
+    update() with many links sorts them once. Other links fall back to an
+    exact set of strings. Supports `in`, add, update, len.
+    """
+    MERGE_AT = 4096
+    MERGE_FRACTION = 8
+    HEADER = struct.Struct("<qq")  # (text_size, number of ids)
+
+    def __init__(self, links=()):
+        self._ids = array("q")
+        self._pending = set()
+        self._other = set()
+        self.update(links)
+
+    def __contains__(self, link):
+        job_id = link_id(link)
+        if job_id is None:
+            return link in self._other
+        return self._has_id(job_id)
+
+    def _in_array(self, job_id):
+        i = bisect_left(self._ids, job_id)
+        return i < len(self._ids) and self._ids[i] == job_id
+
+    def _has_id(self, job_id):
+        return job_id in self._pending or self._in_array(job_id)
+
+    def add(self, link):
+        job_id = link_id(link)
+        if job_id is None:
+            if link:
+                self._other.add(link)
+        elif not self._has_id(job_id):
+            self._pending.add(job_id)
+            if len(self._pending) >= max(self.MERGE_AT, len(self._ids) // self.MERGE_FRACTION):
+                self._merge()
+
+    def update(self, links):
+        ids = set()
+        for link in links:
+            job_id = link_id(link)
+            if job_id is None:
+                if link:
+                    self._other.add(link)
+            else:
+                ids.add(job_id)
+        if len(ids) < self.MERGE_AT:
+            for job_id in ids:
+                if not self._has_id(job_id):
+                    self._pending.add(job_id)
+            if len(self._pending) >= max(self.MERGE_AT, len(self._ids) // self.MERGE_FRACTION):
+                self._merge()
+            return
+        # bulk: drop known ids, then one sort and one merge
+        ids.difference_update(self._pending)
+        if self._ids:
+            ids = {job_id for job_id in ids if not self._in_array(job_id)}
+        self._pending.update(ids)
+        self._merge()
+
+    def __len__(self):
+        return len(self._ids) + len(self._pending) + len(self._other)
+
+    def _merge(self):
+        if self._pending:
+            # pending ids are never in the array: sort only them, merge the two sorted runs
+            pending = sorted(self._pending)
+            self._ids = array("q", merge(self._ids, pending) if self._ids else pending)
+            self._pending = set()
+
+    # -----------------------------------
+    # PERSISTENCE
+    # -----------------------------------
+    def save(self, path, text_size):
+        """Write ids (+ non-numeric links) with the Storage text size they match."""
+        self._merge()
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(text_size, len(self._ids)))
+            self._ids.tofile(f)
+            f.write("\n".join(sorted(self._other)).encode("utf-8"))
+
+    @classmethod
+    def load(cls, path, text_size):
+        """Load a saved set, or return None if missing or out of date."""
+        if not os.path.exists(path):
+            return None
+        link_set = cls()
+        with open(path, "rb") as f:
+            header = f.read(cls.HEADER.size)
+            if len(header) < cls.HEADER.size:
+                return None
+            saved_size, count = cls.HEADER.unpack(header)
+            if saved_size != text_size:
+                return None
+            try:
+                link_set._ids.fromfile(f, count)
+            except EOFError:
+                return None
+            other = f.read().decode("utf-8")
+        link_set._other = set(other.split("\n")) if other else set()
+        return link_set
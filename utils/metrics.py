@@ -0,0 +1,175 @@
+import json, os, threading, time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+
+# -----------------------------------
+# RUN METRICS (COUNTERS + TIMING HISTOGRAMS)
+# -----------------------------------
+class Histogram:
+    """Timing distribution in fixed buckets (seconds), plus count/sum/min/max."""
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect_left(self.BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 4),
+            "mean": round(self.sum / self.count, 4) if self.count else 0.0,
+            "min": round(self.min or 0.0, 4),
+            "max": round(self.max or 0.0, 4),
+            "buckets": {str(le): n for le, n in zip(self.BUCKETS + ("+Inf",), self.counts)},
+        }
+
+
+def metric_key(name, labels):
+    """Prometheus-style series name: name{label="value",...}"""
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{k}="{v}"' for k, v in sorted(labels.items())) + "}"
+
+
+class Metrics:
+    """
+    Counters and timing histograms of one scraper run, safe to use from threads.
+
+    Series are a name plus optional labels, e.g.
+    metrics.observe("stage_seconds", 0.2, stage="title").
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = Histogram()
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def report(self):
+        """JSON-ready dict of all series."""
+        with self._lock:
+            return {
+                "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)),
+                "counters": {metric_key(n, dict(l)): round(v, 4) for (n, l), v in sorted(self.counters.items())},
+                "histograms": {metric_key(n, dict(l)): h.to_dict() for (n, l), h in sorted(self.histograms.items())},
+            }
+
+    def prometheus_samples(self, prefix="job_scraper_", **extra):
+        """(metric family, type, sample line) in text exposition format; extra labels go on every sample."""
+        samples = []
+        with self._lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                full = prefix + name
+                samples.append((full, "counter", f"{metric_key(full, {**extra, **dict(labels)})} {value}"))
+            for (name, labels), hist in sorted(self.histograms.items()):
+                full = prefix + name
+                labels = {**extra, **dict(labels)}
+                cumulative = 0
+                for le, n in zip(Histogram.BUCKETS + ("+Inf",), hist.counts):
+                    cumulative += n
+                    samples.append((full, "histogram", f"{metric_key(full + '_bucket', {**labels, 'le': le})} {cumulative}"))
+                samples.append((full, "histogram", f"{metric_key(full + '_sum', labels)} {hist.sum}"))
+                samples.append((full, "histogram", f"{metric_key(full + '_count', labels)} {hist.count}"))
+        return samples
+
+
+class NullMetrics:
+    """Metrics that record nothing: the default outside of run_scraper."""
+
+    def inc(self, name, value=1, **labels):
+        pass
+
+    def observe(self, name, value, **labels):
+        pass
+
+    def timer(self, name, **labels):
+        return nullcontext()
+
+
+NO_METRICS = NullMetrics()
+
+
+# -----------------------------------
+# EXPORT
+# -----------------------------------
+def _write_atomic(path, text):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def write_json_report(path, summaries):
+    """Run report: one entry per search summary, its Metrics expanded."""
+    searches = [
+        {**s, "metrics": s["metrics"].report()} if isinstance(s.get("metrics"), Metrics) else s
+        for s in summaries
+    ]
+    _write_atomic(path, json.dumps({"searches": searches}, ensure_ascii=False, indent=1))
+
+
+def write_prometheus_textfile(path, summaries):
+    """Textfile for node_exporter's textfile collector; series labelled by search name."""
+    families = {}
+    for s in summaries:
+        if isinstance(s.get("metrics"), Metrics):
+            for family, kind, line in s["metrics"].prometheus_samples(search=s["name"]):
+                families.setdefault((family, kind), []).append(line)
+    # one TYPE line per family, its samples from all searches grouped under it
+    lines = []
+    for (family, kind), samples in families.items():
+        lines.append(f"# TYPE {family} {kind}")
+        lines += samples
+    _write_atomic(path, "\n".join(lines) + "\n")
+
+
+# -----------------------------------
+# PROFILING (-profile)
+# -----------------------------------
+@contextmanager
+def profiled(path=None, top=30):
+    """Run the block under cProfile when path is set: dump pstats to path, print the top functions."""
+    if not path:
+        yield
+        return
+    import cProfile, pstats
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(top)
+        print(f"📈 Profile saved to {path} (browse: python -m pstats {path})")
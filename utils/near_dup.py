@@ -0,0 +1,98 @@
+import random, re
+from array import array
+from hashlib import blake2b
+
+# -----------------------------------
+# TEXT NORMALIZATION
+# -----------------------------------
+WORD = re.compile(r"\w+")
+
+
+def normalize_text(text):
+    """Lowercase words only: reposts differing in spacing/punctuation compare equal."""
+    return " ".join(WORD.findall((text or "").lower()))
+
+
+# -----------------------------------
+# MINHASH + LSH NEAR-DUPLICATE INDEX
+# -----------------------------------
+class MinHash:
+    """
+    MinHash signatures over word shingles.
+
+    The share of equal positions in two signatures estimates the Jaccard
+    similarity of the two texts' shingle sets.
+    """
+    PRIME = (1 << 61) - 1
+
+    def __init__(self, num_perm=64, shingle_size=5, seed=1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rnd = random.Random(seed)
+        self.perms = [(rnd.randrange(1, self.PRIME), rnd.randrange(0, self.PRIME)) for _ in range(num_perm)]
+
+    def shingles(self, text):
+        words = normalize_text(text).split()
+        k = self.shingle_size
+        if len(words) <= k:
+            return {" ".join(words)} if words else set()
+        return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+    def signature(self, text):
+        """array('Q') of num_perm minimums, or None for empty text."""
+        hashes = [int.from_bytes(blake2b(s.encode(), digest_size=8).digest(), "little") for s in self.shingles(text)]
+        if not hashes:
+            return None
+        prime = self.PRIME
+        return array("Q", (min((a * h + b) % prime for h in hashes) for a, b in self.perms))
+
+    @staticmethod
+    def similarity(sig_a, sig_b):
+        return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+class NearDuplicateIndex:
+    """
+    Finds a stored signature similar to a new one without comparing against all.
+
+    Signatures are cut into `bands`; texts sharing any band are candidates
+    (locality-sensitive hashing), candidates are confirmed by estimated
+    similarity >= threshold.
+    """
+
+    def __init__(self, num_perm=64, bands=16, threshold=0.8):
+        self.rows = num_perm // bands
+        self.bands = bands
+        self.threshold = threshold
+        self._buckets = {}
+        self._signatures = {}
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+
+    def add(self, key, signature):
+        if signature is None or key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, []).append(key)
+
+    def query(self, signature):
+        """Key of the most similar stored text above threshold, or None."""
+        if signature is None:
+            return None
+        best, best_score = None, self.threshold
+        checked = set()
+        for band_key in self._band_keys(signature):
+            for key in self._buckets.get(band_key, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                score = MinHash.similarity(signature, self._signatures[key])
+                if score >= best_score:
+                    best, best_score = key, score
+        return best
+
+    def __len__(self):
+        return len(self._signatures)
@@ -0,0 +1,64 @@
+import time
+
+from utils.metrics import NO_METRICS
+
+# -----------------------------------
+# STAGED FILTER PIPELINE
+# -----------------------------------
+class Stage:
+    """
+    One pipeline step.
+
+    keep(item) -> bool   drops the items it returns False for (cheap, per item)
+    batch(items) -> list works on all survivors at once (e.g. concurrent fetch)
+    """
+
+    def __init__(self, name, keep=None, batch=None):
+        self.name = name
+        self.keep = keep
+        self.batch = batch
+        self.seen = 0
+        self.dropped = 0
+        self.seconds = 0.0
+
+    def run(self, items, metrics=NO_METRICS):
+        start = time.perf_counter()
+        if self.batch is not None:
+            survivors = list(self.batch(items))
+        else:
+            survivors = [item for item in items if self.keep(item)]
+        seconds = time.perf_counter() - start
+        self.seconds += seconds
+        self.seen += len(items)
+        self.dropped += len(items) - len(survivors)
+        metrics.observe("stage_seconds", seconds, stage=self.name)
+        metrics.inc("stage_items_total", len(items), stage=self.name)
+        metrics.inc("stage_dropped_total", len(items) - len(survivors), stage=self.name)
+        return survivors
+
+
+class Pipeline:
+    """Runs items through stages in order; stage counters accumulate across runs."""
+
+    def __init__(self, stages, logger):
+        self.stages = stages
+        self.logger = logger
+
+    def run(self, items, metrics=NO_METRICS):
+        items = list(items)
+        parts = []
+        for stage in self.stages:
+            if not items:
+                break
+            dropped, seconds = stage.dropped, stage.seconds
+            items = stage.run(items, metrics)
+            parts.append(f"{stage.name} -{stage.dropped - dropped} ({stage.seconds - seconds:.2f}s)")
+        self.logger.info(f"📊 Pipeline: {', '.join(parts)} -> {len(items)} left")
+        return items
+
+    def report(self):
+        for stage in self.stages:
+            self.logger.info(
+                f"📊 stage {stage.name}: in={stage.seen} dropped={stage.dropped} "
+                f"time={stage.seconds:.2f}s"
+            )
@@ -0,0 +1,28 @@
+import heapq, itertools
+
+# -----------------------------------
+# TOP-K MATCHES BY SCORE
+# -----------------------------------
+class TopK:
+    """Keeps only the k best-scored jobs seen so far (min-heap, O(k) memory)."""
+
+    def __init__(self, k):
+        self.k = k
+        self._heap = []
+        self._seq = itertools.count()  # tie-break: earlier job wins
+
+    def push(self, job):
+        if self.k <= 0:
+            return
+        entry = (job.score or 0, -next(self._seq), job)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def best(self):
+        """Jobs ordered from best to worst score."""
+        return [job for _, _, job in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+    def __len__(self):
+        return len(self._heap)
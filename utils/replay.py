@@ -0,0 +1,99 @@
+import hashlib, json, os, time
+from urllib.parse import parse_qsl, urlencode
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+# -----------------------------------
+# RECORD / REPLAY HTTP TRANSPORT
+# -----------------------------------
+# Mounted on a requests.Session:
+#   live run   -> RecordingAdapter saves every response to a fixture directory
+#   replay run -> ReplayAdapter serves them back, no network needed
+# Each exchange is stored as <key>.json (request + status/headers) and
+# <key>.body (raw bytes). The key is method + url + form body, without
+# per-session values like the CSRF token, so replays match across runs.
+IGNORED_FORM_FIELDS = {"csrfmiddlewaretoken"}
+
+
+def request_key(method, url, body):
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    if body:
+        fields = [(k, v) for k, v in parse_qsl(body, keep_blank_values=True) if k not in IGNORED_FORM_FIELDS]
+        body = urlencode(sorted(fields))
+    raw = f"{method.upper()} {url}\n{body or ''}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def build_response(adapter, request, status, reason, headers, content, encoding=None):
+    """requests Response for a stored exchange (body stored decoded)."""
+    resp = Response()
+    resp.status_code = status
+    resp.reason = reason
+    # body is stored decoded, drop transfer headers that no longer apply
+    resp.headers = CaseInsensitiveDict({
+        k: v for k, v in headers.items() if k.lower() not in ("content-encoding", "transfer-encoding")
+    })
+    resp.encoding = encoding
+    resp._content = content
+    resp.url = request.url
+    resp.request = request
+    resp.connection = adapter
+    return resp
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Real transport that also writes each response to fixture_dir."""
+
+    def __init__(self, fixture_dir, **kwargs):
+        super().__init__(**kwargs)
+        self.fixture_dir = fixture_dir
+        os.makedirs(fixture_dir, exist_ok=True)
+
+    def send(self, request, **kwargs):
+        resp = super().send(request, **kwargs)
+        key = request_key(request.method, request.url, request.body)
+        path = os.path.join(self.fixture_dir, key)
+        with open(path + ".body", "wb") as f:
+            f.write(resp.content)
+        with open(path + ".json", "w", encoding="utf-8") as f:
+            json.dump({
+                "method": request.method,
+                "url": request.url,
+                "status": resp.status_code,
+                "reason": resp.reason,
+                "headers": dict(resp.headers),
+                "encoding": resp.encoding,
+            }, f, ensure_ascii=False, indent=1)
+        return resp
+
+
+class ReplayAdapter(BaseAdapter):
+    """Serves recorded responses from fixture_dir, with optional latency per request."""
+
+    def __init__(self, fixture_dir, latency=0.0):
+        super().__init__()
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key = request_key(request.method, request.url, request.body)
+        path = os.path.join(self.fixture_dir, key)
+        if not os.path.exists(path + ".json"):
+            raise requests.ConnectionError(f"No recorded response for {request.method} {request.url}", request=request)
+
+        with open(path + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(path + ".body", "rb") as f:
+            content = f.read()
+        if self.latency:
+            time.sleep(self.latency)
+
+        return build_response(self, request, meta["status"], meta.get("reason"), meta["headers"],
+                              content, meta.get("encoding"))
+
+    def close(self):
+        pass
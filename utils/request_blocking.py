@@ -0,0 +1,88 @@
+import json
+
+# -----------------------------------
+# BROWSER REQUEST BLOCKING (CHROME DEVTOOLS PROTOCOL)
+# -----------------------------------
+class RequestBlocker:
+    """
+    Keeps Chrome from loading resources a scraper never reads.
+
+    install() sends Network.setBlockedURLs (patterns with * wildcards) to the
+    driver's tab. collect() drains Chrome's performance log and counts
+    blocked requests per resource type and the bytes actually received.
+    Blocked requests are never downloaded, so their bytes are estimated from
+    typical sizes per type. The driver needs the "goog:loggingPrefs"
+    {"performance": "ALL"} capability for the counters; blocking works
+    without it.
+    """
+    # typical transfer size of a blocked request, bytes
+    ESTIMATED_BYTES = {
+        "Image": 25_000,
+        "Font": 40_000,
+        "Media": 500_000,
+        "Stylesheet": 30_000,
+        "Script": 60_000,
+        "Ping": 500,
+        "Other": 2_000,
+    }
+    # setBlockedURLs failures carry this blockedReason
+    BLOCKED_REASON = "inspector"
+
+    def __init__(self, driver, patterns, logger=None):
+        self.driver = driver
+        self.patterns = list(patterns)
+        self.logger = logger
+        self.blocked = {}       # resource type -> requests
+        self.received_bytes = 0
+        self.requests = 0
+
+    def install(self):
+        # older performance-log entries belong to earlier searches in this browser
+        self.collect(count=False)
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+
+    def collect(self, count=True):
+        """Read new performance-log entries into the counters."""
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            # no performance logging on this driver
+            return
+        if not count:
+            return
+        for entry in entries:
+            message = entry["message"]
+            # skip the bulk of the log without parsing it
+            if '"Network.loadingFailed"' not in message and '"Network.loadingFinished"' not in message:
+                continue
+            event = json.loads(message)["message"]
+            params = event.get("params", {})
+            if event["method"] == "Network.loadingFinished":
+                self.requests += 1
+                self.received_bytes += int(params.get("encodedDataLength", 0))
+            elif params.get("blockedReason") == self.BLOCKED_REASON:
+                kind = params.get("type", "Other")
+                self.blocked[kind] = self.blocked.get(kind, 0) + 1
+
+    def saved_bytes(self):
+        other = self.ESTIMATED_BYTES["Other"]
+        return sum(n * self.ESTIMATED_BYTES.get(kind, other) for kind, n in self.blocked.items())
+
+    def record(self, metrics):
+        """Add the counters to a utils.metrics.Metrics."""
+        for kind, n in self.blocked.items():
+            metrics.inc("blocked_requests_total", n, type=kind)
+        metrics.inc("blocked_bytes_estimate_total", self.saved_bytes())
+        metrics.inc("received_bytes_total", self.received_bytes)
+
+    def report(self, logger=None):
+        logger = logger or self.logger
+        if logger is None:
+            return
+        blocked = sum(self.blocked.values())
+        kinds = ", ".join(f"{kind} {n}" for kind, n in sorted(self.blocked.items(), key=lambda kv: -kv[1]))
+        logger.info(
+            f"🚫 Blocked {blocked} requests ({kinds or 'none'}), ~{self.saved_bytes() / 1e6:.1f} MB saved; "
+            f"{self.requests} requests loaded, {self.received_bytes / 1e6:.1f} MB received"
+        )
@@ -1,12 +1,33 @@
-import os, re
+import os
 import csv
+import time
+
+from utils.job import Job
+from utils.job_index import JobIndex, RejectedJobs
+from utils.job_reader import iter_job_records, iter_links
+from utils.link_set import CompactLinkSet
+from utils.metrics import NO_METRICS
 
 class Storage:
     OUTPUT_FILE = "filtered_jobs.txt"
+    INDEX_SUFFIX = ".idx.sqlite"
+    LINKS_SUFFIX = ".links.bin"
+
+    # description chars kept inline when full texts go to a DescriptionStore
+    PREVIEW_CHARS = 200
 
-    def __init__(self, logger, file_name):
+    def __init__(self, logger, file_name, use_index=True, descriptions=None):
         self.logger = logger
         self.OUTPUT_FILE = file_name
+        # optional utils.description_store.DescriptionStore (shared between files)
+        self.descriptions = descriptions
+        # utils.metrics.Metrics of the current run (set by run_scraper)
+        self.metrics = NO_METRICS
+        # link index beside the text file, startup reads only the keys
+        self.index = JobIndex(file_name + self.INDEX_SUFFIX) if use_index else None
+
+    def _text_size(self):
+        return os.path.getsize(self.OUTPUT_FILE) if os.path.exists(self.OUTPUT_FILE) else 0
 
     # -----------------------------------
     # LOAD PREVIOUS JOBS
@@ -18,20 +39,76 @@ class Storage:
             reader = csv.DictReader(f)
             return set(row["link"] for row in reader)
 
-    def load_existing_jobs(self):
+    def load_existing_jobs(self, compact=False):
+        """
+        Return the set of saved links.
+
+        compact=True returns a CompactLinkSet (numeric ids), loaded from
+        <file>.links.bin when it matches the text file, else built once and saved.
+        """
+        if not compact:
+            return self._load_links()
+
+        path = self.OUTPUT_FILE + self.LINKS_SUFFIX
+        links = CompactLinkSet.load(path, self._text_size())
+        if links is None:
+            links = CompactLinkSet(self._load_links())
+            links.save(path, self._text_size())
+        return links
+
+    def save_link_set(self, links):
+        """Persist a CompactLinkSet so the next run loads it without rebuilding."""
+        if isinstance(links, CompactLinkSet):
+            links.save(self.OUTPUT_FILE + self.LINKS_SUFFIX, self._text_size())
+
+    def _load_links(self):
+        if self.index is None:
+            return self.scan_existing_jobs()
+
+        text_size = self._text_size()
+        if not self.index.is_in_sync(text_size):
+            # one-time migration of an existing file (or one changed outside of Storage)
+            links = self.scan_existing_jobs()
+            self.index.rebuild(links, text_size)
+            self.logger.info(f"🗂 Indexed {len(links)} jobs from {self.OUTPUT_FILE}")
+            return links
+        return self.index.links()
+
+    def rejected_jobs(self, config):
+        """RejectedJobs for a filter config hash (None without an index)."""
+        return RejectedJobs(self.index, config) if self.index is not None else None
+
+    def scan_existing_jobs(self):
+        """Collect links by streaming through the text file."""
         if not os.path.exists(self.OUTPUT_FILE):
             return set()
+        return set(iter_links(self.OUTPUT_FILE))
 
-        job_links = set()
-        with open(self.OUTPUT_FILE, encoding="utf-8") as f:
-            content = f.read()
+    def iter_jobs(self, fields=None):
+        """
+        Yield saved jobs as Jobs, block by block (see utils.job_reader).
 
-            # Each job block ends with link=...
-            matches = re.findall(r" link=(.+)", content)
-            for link in matches:
-                job_links.add(link.strip())
+        With a DescriptionStore, a description written as preview + hash is
+        loaded from the store only when job.description is read.
+        fields: optional keys to parse, others keep the Job defaults.
+        """
+        if not os.path.exists(self.OUTPUT_FILE):
+            return
+        wanted = None if fields is None else set(fields) | {"description_hash"}
+        for record in iter_job_records(self.OUTPUT_FILE, wanted):
+            key = record.pop("description_hash", "")
+            if key and self.descriptions is not None and "description" in record:
+                record["description"] = self.descriptions.loader(key)
+            record["score"] = self._parse_score(record.get("score", ""))
+            yield Job(**record)
 
-        return job_links
+    @staticmethod
+    def _parse_score(value):
+        try:
+            score = float(value)
+        except ValueError:
+            return None
+        return int(score) if score.is_integer() else score
 
     # -----------------------------------
     # SAVE JOBS (APPEND NEW ONLY)
@@ -42,7 +119,10 @@ class Storage:
             writer = csv.DictWriter(f, fieldnames=["title", "company", "description", "link"])
             if not file_exists:
                 writer.writeheader()
-            writer.writerows(jobs)
+            writer.writerows(
+                {"title": job.title, "company": job.company, "description": job.description, "link": job.link}
+                for job in jobs
+            )
         self.logger.info(f"\n✅ Saved {len(jobs)} new jobs to {self.OUTPUT_FILE}")
 
     def save_jobs_to_file(self, jobs, existing_links):
@@ -56,17 +136,87 @@ class Storage:
         2. ----------------------------
         ...
         """
+        started = time.perf_counter()
         i = len(existing_links)
         with open(self.OUTPUT_FILE, "a", newline="", encoding="utf-8") as f:
             for i, job in enumerate(jobs, start=i+1):
                 f.write(f"{i}. ----------------------------\n")
-                f.write(f" title={job.get('title','')}\n")
-                f.write(f" company={job.get('company','')}\n")
-                f.write(f" location={job.get('location','')}\n")
-                f.write(f" salary={job.get('salary','')}\n")      # optional
-                f.write(f" date={job.get('date','')}\n")          # optional
-                f.write(f" description={job.get('description','')}\n")
-                f.write(f" link={job.get('link','')}\n")
+                f.write(f" title={job.title}\n")
+                f.write(f" company={job.company}\n")
+                f.write(f" location={job.location}\n")
+                f.write(f" salary={job.salary}\n")      # optional
+                f.write(f" date={job.date}\n")          # optional
+                f.write(f" score={'' if job.score is None else job.score}\n")  # optional
+                self._write_description(f, job)
+                if job.repost_of:
+                    f.write(f" repost_of={job.repost_of}\n")  # same description as this saved link
+                f.write(f" link={job.link}\n")
                 f.write("\n")  # Add a blank line between jobs
 
-        self.logger.info(f"\n✅ Saved {len(jobs)} new jobs to {self.OUTPUT_FILE}")
\ No newline at end of file
+        if self.index is not None:
+            # one transaction per saved page
+            self.index.add_links((job.link for job in jobs), self._text_size())
+
+        self.metrics.observe("storage_write_seconds", time.perf_counter() - started, file=self.OUTPUT_FILE)
+        self.metrics.inc("storage_jobs_written_total", len(jobs), file=self.OUTPUT_FILE)
+
+        self.logger.info(f"\n✅ Saved {len(jobs)} new jobs to {self.OUTPUT_FILE}")
+
+    def _write_description(self, f, job):
+        description = job.description
+        if self.descriptions is None or not description:
+            f.write(f" description={description}\n")
+            return
+        # full text stored once by content, the text file keeps a preview and the hash
+        key = self.descriptions.put(description)
+        self.descriptions.add_link(job.link, key)
+        if job.summary_key:
+            self.descriptions.add_alias(job.summary_key, key)
+        preview = description[:self.PREVIEW_CHARS]
+        f.write(f" description={preview}{'…' if len(description) > len(preview) else ''}\n")
+        f.write(f" description_hash={key}\n")
+
+# -----------------------------------
+# BUFFERED WRITER (JOB STREAM -> FILE)
+# -----------------------------------
+class JobWriter:
+    """
+    Appends a stream of jobs to one Storage.
+
+    Jobs already in `known` are skipped. The buffer goes to disk every
+    FLUSH_EVERY jobs, after FLUSH_SECONDS, and on flush(); written links are
+    then added to `known`. `written` counts the jobs saved by this writer.
+    """
+    FLUSH_EVERY = 10
+    FLUSH_SECONDS = 30.0
+
+    def __init__(self, storage, known, flush_every=None, flush_seconds=None):
+        self.storage = storage
+        self.known = known
+        self.flush_every = flush_every or self.FLUSH_EVERY
+        self.flush_seconds = flush_seconds or self.FLUSH_SECONDS
+        self.written = 0
+        self._buffer = []
+        self._pending = set()
+        self._flushed_at = time.monotonic()
+
+    def add(self, job):
+        """Buffer a job; return False if its link is already known."""
+        link = job.link
+        if link in self.known or link in self._pending:
+            return False
+        self._buffer.append(job)
+        self._pending.add(link)
+        if len(self._buffer) >= self.flush_every or time.monotonic() - self._flushed_at >= self.flush_seconds:
+            self.flush()
+        return True
+
+    def flush(self):
+        self._flushed_at = time.monotonic()
+        if not self._buffer:
+            return
+        self.storage.save_jobs_to_file(self._buffer, self.known)
+        self.known.update(self._pending)
+        self.written += len(self._buffer)
+        self._buffer = []
+        self._pending = set()
@@ -0,0 +1,107 @@
+import json, os, threading, time
+
+# -----------------------------------
+# PER-SEARCH WATERMARKS
+# -----------------------------------
+class Watermarks:
+    """Newest job seen per search URL, kept in a small JSON file."""
+    FILE = "watermarks.json"
+    # searches of one run share the file
+    _lock = threading.Lock()
+
+    def __init__(self, path=None):
+        self.path = path or self.FILE
+        self.marks = self._read()
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def get(self, key):
+        return self.marks.get(key)
+
+    def update(self, key, link, date=""):
+        """Store the mark for one search, keeping marks other searches saved meanwhile."""
+        with self._lock:
+            self.marks = self._read()
+            self.marks[key] = {"link": link, "date": date, "updated": time.strftime("%Y-%m-%d %H:%M:%S")}
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.marks, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.path)
+
+
+# -----------------------------------
+# INCREMENTAL CRAWL / EARLY STOP
+# -----------------------------------
+class IncrementalCrawl:
+    """
+    Decides when paginating further only re-walks known history.
+
+    Scrapers call observe() for every card in listing order; run_scraper
+    calls end_page() after each page and stops when should_stop(). Rules
+    (per scraper, see INCREMENTAL on the scraper class):
+      watermark   - stop once the newest card of the last run shows up again
+                    (only for newest-first listings)
+      known_streak - stop after this many consecutive known cards (0 = off)
+      known_page  - stop after a page where every card was known
+    The watermark is only moved forward by commit(), after a complete run.
+    A card is known when the scraper says so (stored, viewed, rejected by
+    the filters) or when its link is in `also_known` (e.g. the
+    matched-title file).
+    """
+
+    def __init__(self, watermarks, key, watermark=True, known_streak=0, known_page=False, enabled=True,
+                 also_known=()):
+        self.watermarks = watermarks
+        self.key = key
+        self.use_watermark = watermark
+        self.known_streak = known_streak
+        self.known_page = known_page
+        self.enabled = enabled
+        self.also_known = also_known
+        self.previous = watermarks.get(key) if watermark else None
+        self.newest = None
+        self.streak = 0
+        self.reached = False
+        self.page_cards = 0
+        self.page_known = 0
+        self.page_fully_known = False
+
+    def observe(self, link, known, date=""):
+        if not link:
+            return
+        known = known or link in self.also_known
+        if self.newest is None:
+            self.newest = {"link": link, "date": date}
+        if self.previous and link == self.previous["link"]:
+            self.reached = True
+        self.streak = self.streak + 1 if known else 0
+        self.page_cards += 1
+        self.page_known += 1 if known else 0
+
+    def end_page(self):
+        self.page_fully_known = self.page_cards > 0 and self.page_known == self.page_cards
+        self.page_cards = self.page_known = 0
+
+    def should_stop(self):
+        if not self.enabled:
+            return False
+        return (
+            self.reached
+            or (self.known_streak and self.streak >= self.known_streak)
+            or (self.known_page and self.page_fully_known)
+        )
+
+    def reason(self):
+        if self.reached:
+            return f"reached last run's newest job {self.previous['link']}"
+        if self.known_streak and self.streak >= self.known_streak:
+            return f"{self.streak} known jobs in a row"
+        return "whole page already known"
+
+    def commit(self):
+        if self.use_watermark and self.newest:
+            self.watermarks.update(self.key, self.newest["link"], self.newest["date"])